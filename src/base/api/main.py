@@ -1,23 +1,48 @@
+import asyncio
 import logging
+import signal
+import time
+from collections.abc import Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
+from base.api.middleware import add_middlewares
 from base.api.router.auth import router as auth_router
 from base.api.router.default import router as default_router
+from base.api.router.file import router as file_router
+from base.api.router.file import upload_db
+from base.api.router.health import router as health_router
+from base.api.router.job import jobs
+from base.api.router.job import router as job_router
+from base.api.router.ws import router as ws_router
+from base.api.staticfiles import PrecompressedStaticFiles
+from base.api.templating import CachedJinja2Templates
+from base.config import settings
+from base.utils.auth import MOCK_CLIENTS_DB, create_access_token, decode_access_token, verify_password
 
 logger = logging.getLogger(__file__)
 
+# 실패하면 트래픽을 받을 수 없는 워밍업 단계 (나머지는 첫 요청이 느려질 뿐이므로 로그만 남김)
+REQUIRED_WARM_UP_STEPS = frozenset({"database"})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    app.state.ready = app.state.draining = False
     startup_event()
+    failed = warm_up(app)
+    if settings.app.job.enabled:
+        await jobs.start()
+    app.state.ready = not REQUIRED_WARM_UP_STEPS & failed
+    if not app.state.ready:
+        logger.error(f"NOT READY: required warm-up step failed: {sorted(REQUIRED_WARM_UP_STEPS & failed)}")
+    restore_signals = install_drain_handler(app)
     yield
+    restore_signals()
+    await jobs.stop()
     shutdown_event()
 
 
@@ -29,6 +54,88 @@ def startup_event():
         raise RuntimeError(f"Failed to start server: {e}")
 
 
+def install_drain_handler(app: FastAPI) -> Callable[[], None]:
+    """
+    종료 신호를 받으면 readiness를 바로 503으로 내립니다.
+    uvicorn은 종료를 시작하는 즉시(should_exit) 소켓을 닫으므로 lifespan 종료 단계에서 내리면 아무도 볼 수 없습니다.
+    그래서 SIGTERM은 health.drain_seconds 동안 uvicorn에 늦게 전달하여 로드밸런서가 503을 보고 라우팅을 멈출 시간을 줍니다.
+    SIGINT(Ctrl+C)와 drain 중 다시 받은 신호는 바로 전달합니다.
+    :param app: FastAPI 앱
+    :return: 원래 신호 핸들러를 복원하는 함수
+    """
+    loop = asyncio.get_running_loop()
+    drain_seconds = settings.app.health.drain_seconds
+    previous = {sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT)}
+
+    def forward(sig, frame):
+        handler = previous[sig]
+        if callable(handler):
+            handler(sig, frame)
+        else:
+            signal.signal(sig, handler)
+            signal.raise_signal(sig)
+
+    def handle_signal(sig, frame):
+        draining = app.state.draining
+        app.state.ready = False
+        app.state.draining = True
+        if sig == signal.SIGTERM and drain_seconds > 0 and not draining:
+            logger.info(f"DRAINING for {drain_seconds} s before shutdown")
+            loop.call_soon_threadsafe(loop.call_later, drain_seconds, forward, sig, frame)
+        else:
+            forward(sig, frame)
+
+    try:
+        for sig in previous:
+            signal.signal(sig, handle_signal)
+    except ValueError:
+        # 신호 핸들러는 메인 스레드에서만 설치할 수 있습니다. (예: 다른 스레드에서 lifespan을 실행하는 테스트 클라이언트)
+        return lambda: None
+
+    def restore():
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+    return restore
+
+
+def warm_up(app: FastAPI) -> set[str]:
+    """
+    첫 요청이 떠안던 초기화 비용(템플릿 컴파일, bcrypt/JWT 첫 호출, OpenAPI 스키마 생성, DB 연결)을
+    트래픽을 받기 전에 미리 수행합니다. 실패한 단계는 로그를 남기고 계속 진행합니다.
+    :return: 실패한 단계 이름
+    """
+
+    def warm_up_auth():
+        user = settings.app.auth.root_user
+        verify_password(settings.app.auth.root_password, MOCK_CLIENTS_DB[user]["hashed_secret"])
+        decode_access_token(create_access_token(data={"sub": user}))
+
+    def warm_up_database():
+        with upload_db.engine.connect():
+            pass
+
+    steps = {
+        "templates": app.templates.precompile,
+        "auth": warm_up_auth,
+        "openapi": app.openapi,
+        "database": warm_up_database,
+    }
+
+    failed = set()
+    total = time.perf_counter()
+    for name, step in steps.items():
+        start = time.perf_counter()
+        try:
+            step()
+            logger.info(f"WARM-UP {name} done in {(time.perf_counter() - start) * 1_000:.3f} ms")
+        except Exception as e:
+            logger.warning(f"WARM-UP {name} failed: {e}")
+            failed.add(name)
+    logger.info(f"WARM-UP completed in {(time.perf_counter() - total) * 1_000:.3f} ms")
+    return failed
+
+
 def shutdown_event():
     try:
         # await database.disconnect()
@@ -42,16 +149,41 @@ app = FastAPI(lifespan=lifespan)
 template_dir = Path(__file__).parent / "templates"
 static_dir = Path(__file__).parent / "static"
 
-app.templates = Jinja2Templates(directory=template_dir)
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
-app.add_middleware(
-    CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"]
+static_files = PrecompressedStaticFiles(
+    directory=static_dir,
+    build_dir=settings.app.static.build_dir,
+    prefix="/static",
+    min_size=settings.app.static.min_size,
+    max_age=settings.app.static.max_age,
+)
+
+app.templates = CachedJinja2Templates(
+    directory=template_dir,
+    cache_dir=settings.app.template.cache_dir,
+    cacheable=settings.app.template.cacheable,
+    maxsize=settings.app.template.render_cache_size,
+)
+app.templates.env.globals["static_url"] = static_files.url
+app.mount("/static", static_files, name="static")
+add_middlewares(
+    app,
+    settings.app.middleware.order,
+    {
+        "cors": settings.app.middleware.cors.model_dump(),
+        "compression": (
+            settings.env.compression.model_dump(exclude={"enabled"}) if settings.env.compression.enabled else None
+        ),
+    },
 )
 
+app.include_router(health_router)
 app.include_router(default_router)
 app.include_router(auth_router)
+app.include_router(file_router)
+app.include_router(job_router)
+app.include_router(ws_router)
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    return app.templates.TemplateResponse("index.html", context={"request": request})
+    return app.templates.CachedTemplateResponse(request, "index.html")
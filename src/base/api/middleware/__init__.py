@@ -0,0 +1,6 @@
+from base.api.middleware.base import HTTPMiddleware
+from base.api.middleware.compression import CompressionMiddleware
+from base.api.middleware.cors import CORSMiddleware
+from base.api.middleware.stack import MIDDLEWARES, add_middlewares
+
+__all__ = ["HTTPMiddleware", "CompressionMiddleware", "CORSMiddleware", "MIDDLEWARES", "add_middlewares"]
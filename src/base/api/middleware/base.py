@@ -0,0 +1,23 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class HTTPMiddleware:
+    """
+    http 요청만 처리하는 순수 ASGI 미들웨어의 기반 클래스.
+
+    BaseHTTPMiddleware와 달리 Request/Response 객체 생성, 본문 스트림 중계용 태스크/큐가 없으므로
+    레이어를 추가해도 요청당 비용이 함수 호출 한 번 수준입니다.
+    하위 클래스는 handle()에서 scope/receive/send를 직접 다루며, 응답을 바꿀 때는 send를 감싸서 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await self.handle(scope, receive, send)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
@@ -0,0 +1,193 @@
+import zlib
+from collections.abc import Callable, Iterable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from base.api.middleware.base import HTTPMiddleware
+from base.utils.common import select_encoding
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency (pip install base[compress])
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency (pip install base[compress])
+    zstandard = None
+
+# (compress, finish) 쌍을 반환하는 인코더 팩토리. 응답마다 새 압축 컨텍스트를 생성합니다.
+Encoder = Callable[[int], tuple[Callable[[bytes], bytes], Callable[[], bytes]]]
+
+
+def _gzip(level: int):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress, compressor.flush
+
+
+def _br(level: int):
+    compressor = brotli.Compressor(quality=level)
+    return compressor.process, compressor.finish
+
+
+def _zstd(level: int):
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return compressor.compress, compressor.flush
+
+
+ENCODERS: dict[str, Encoder] = {"gzip": _gzip}
+if brotli is not None:
+    ENCODERS["br"] = _br
+if zstandard is not None:
+    ENCODERS["zstd"] = _zstd
+
+DEFAULT_EXCLUDED_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+
+class CompressionMiddleware(HTTPMiddleware):
+    """
+    Accept-Encoding에 따라 응답 본문을 zstd/br/gzip으로 압축하는 순수 ASGI 미들웨어.
+
+    - 작은 본문(minimum_size 미만), 이미 인코딩된 응답(Content-Encoding), 압축 효율이 없는 타입은 그대로 전달합니다.
+    - 파일 다운로드(Accept-Ranges/Content-Range, Content-Disposition: attachment)도 그대로 전달합니다.
+      압축하면 Range 오프셋이 원본 기준이라는 전제가 깨져 이어받기가 잘못된 바이트를 받습니다.
+    - 스트리밍 응답(more_body)은 청크 단위로 압축하여 전체 본문을 메모리에 모으지 않습니다.
+    - levels의 키 순서가 서버 선호 순서이며, 설치되지 않은 인코더는 자동으로 제외됩니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        levels: dict[str, int] | None = None,
+        excluded_types: Iterable[str] = DEFAULT_EXCLUDED_TYPES,
+    ) -> None:
+        super().__init__(app)
+        self.minimum_size = minimum_size
+        levels = levels if levels is not None else {"zstd": 3, "br": 4, "gzip": 6}
+        self.levels = {name: level for name, level in levels.items() if name in ENCODERS}
+        self.excluded_types = tuple(excluded_types)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.levels:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""), self.levels)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 하나의 압축 상태. http.response.start를 첫 본문 청크가 도착할 때까지 보류한 뒤 압축 여부를 결정합니다."""
+
+    __slots__ = ("middleware", "encoding", "_send", "start_message", "compress", "finish")
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Message | None = None
+        self.compress: Callable[[bytes], bytes] | None = None
+        self.finish: Callable[[], bytes] | None = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+
+        if self.compress is not None and message_type == "http.response.body":
+            await self._send_chunk(message.get("body", b""), message.get("more_body", False))
+            return
+
+        # start 메시지를 이미 전송했다면 압축 여부가 결정된 상태이므로 그대로 전달합니다.
+        if self.start_message is None:
+            await self._send(message)
+            return
+
+        if message_type != "http.response.body" or not self._should_compress(message):
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        compress, finish = ENCODERS[self.encoding](self.middleware.levels[self.encoding])
+        headers = MutableHeaders(raw=self.start_message["headers"])
+
+        if not more_body:
+            # 단일 본문: 한 번에 압축하고, 이득이 없으면 원본을 전송합니다.
+            compressed = compress(body) + finish()
+            if len(compressed) >= len(body):
+                await self._flush_start()
+                await self._send(message)
+                return
+            self._set_encoding_headers(headers, len(compressed))
+            await self._flush_start()
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
+            return
+
+        self.compress, self.finish = compress, finish
+        self._set_encoding_headers(headers, None)
+        await self._flush_start()
+        await self._send_chunk(body, more_body)
+
+    async def _send_chunk(self, body: bytes, more_body: bool) -> None:
+        chunk = self.compress(body)
+        if not more_body:
+            chunk += self.finish()
+        if chunk or not more_body:
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _should_compress(self, message: Message) -> bool:
+        start = self.start_message
+        if start["status"] < 200 or start["status"] in (204, 206, 304):
+            return False
+
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        if headers.get("accept-ranges", "none") != "none":
+            return False
+        if headers.get("content-disposition", "").lower().startswith("attachment"):
+            return False
+        if headers.get("content-type", "").startswith(self.middleware.excluded_types):
+            return False
+
+        if message.get("more_body", False):
+            content_length = headers.get("content-length")
+            return content_length is None or int(content_length) >= self.middleware.minimum_size
+        return len(message.get("body", b"")) >= self.middleware.minimum_size
+
+    def _set_encoding_headers(self, headers: MutableHeaders, content_length: int | None) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        # 본문 표현이 바뀌므로 강한 ETag는 약한 ETag로 바꿉니다.
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            await self._send(self.start_message)
+            self.start_message = None
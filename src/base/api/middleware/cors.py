@@ -0,0 +1,139 @@
+from collections.abc import Iterable, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from base.api.middleware.base import HTTPMiddleware
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+SAFELISTED_HEADERS = frozenset({"accept", "accept-language", "content-language", "content-type"})
+VARY_ORIGIN = (b"vary", b"Origin")
+VARY_PREFLIGHT = (b"vary", b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers")
+
+
+def _merge_headers(
+    headers: Iterable[tuple[bytes, bytes]], extra: list[tuple[bytes, bytes]]
+) -> list[tuple[bytes, bytes]]:
+    """응답 헤더에 extra를 더하는 함수. 앱이 이미 Vary를 지정했다면 새 줄을 추가하지 않고 값을 이어 붙입니다."""
+    merged = list(headers)
+    for key, value in extra:
+        if key == b"vary":
+            for i, (name, current) in enumerate(merged):
+                if name.lower() == b"vary":
+                    merged[i] = (name, current + b", " + value)
+                    break
+            else:
+                merged.append((key, value))
+        else:
+            merged.append((key, value))
+    return merged
+
+
+class CORSMiddleware(HTTPMiddleware):
+    """
+    응답 헤더를 생성 시점에 미리 계산해 두는 CORS 미들웨어. (starlette CORSMiddleware와 같은 동작)
+
+    - preflight(OPTIONS + Access-Control-Request-Method)는 앱까지 전달하지 않고 미리 만들어 둔 헤더로 바로 응답합니다.
+      max_age(Access-Control-Max-Age) 동안 브라우저가 preflight 결과를 캐시하므로 같은 요청의 preflight가 반복되지 않습니다.
+    - Origin 헤더가 없는 요청(같은 출처, 서버 간 호출)은 send를 감싸지 않고 그대로 통과시킵니다.
+    - allow_credentials가 켜져 있거나 origin 목록을 지정하면 '*' 대신 요청 Origin을 돌려주고 Vary: Origin을 추가합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+    ) -> None:
+        super().__init__(app)
+        methods = ALL_METHODS if "*" in allow_methods else tuple(method.upper() for method in allow_methods)
+
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.allow_methods = frozenset(methods)
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_headers = SAFELISTED_HEADERS | {header.lower() for header in allow_headers}
+        self.echo_origin = allow_credentials or not self.allow_all_origins
+
+        credentials = [(b"access-control-allow-credentials", b"true")] if allow_credentials else []
+        self.simple_headers = list(credentials)
+        if expose_headers:
+            self.simple_headers.append((b"access-control-expose-headers", ", ".join(expose_headers).encode("latin-1")))
+        if self.echo_origin:
+            self.simple_headers.append(VARY_ORIGIN)
+
+        self.preflight_headers = [
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            *credentials,
+            (b"content-type", b"text/plain; charset=utf-8"),
+            VARY_PREFLIGHT,
+        ]
+        if not self.allow_all_headers:
+            allowed = ", ".join(sorted(self.allow_headers)).encode("latin-1")
+            self.preflight_headers.append((b"access-control-allow-headers", allowed))
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        origin = request_method = request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight(origin, request_method, request_headers, send)
+            return
+
+        if self.is_allowed_origin(origin):
+            headers = [(b"access-control-allow-origin", self.allow_origin(origin)), *self.simple_headers]
+        else:
+            # origin 목록을 지정한 경우에만 거부될 수 있으며, 응답이 Origin에 따라 달라지므로 캐시에 알립니다.
+            headers = [VARY_ORIGIN]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = _merge_headers(message.get("headers", ()), headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def is_allowed_origin(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.allow_origins
+
+    def allow_origin(self, origin: bytes) -> bytes:
+        return origin if self.echo_origin else b"*"
+
+    async def preflight(self, origin: bytes, request_method: bytes, request_headers: bytes | None, send: Send) -> None:
+        failures = []
+        headers = [*self.preflight_headers]
+
+        if self.is_allowed_origin(origin):
+            headers.append((b"access-control-allow-origin", self.allow_origin(origin)))
+        else:
+            failures.append("origin")
+
+        if request_method.decode("latin-1").upper() not in self.allow_methods:
+            failures.append("method")
+
+        if request_headers:
+            if self.allow_all_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            else:
+                requested = (header.strip().lower() for header in request_headers.decode("latin-1").split(","))
+                if any(header and header not in self.allow_headers for header in requested):
+                    failures.append("headers")
+
+        body = f"Disallowed CORS {', '.join(failures)}".encode() if failures else b"OK"
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": 400 if failures else 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,40 @@
+import logging
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from starlette.applications import Starlette
+
+from base.api.middleware.compression import CompressionMiddleware
+from base.api.middleware.cors import CORSMiddleware
+
+logger = logging.getLogger(__name__)
+
+# settings.yaml의 middleware.order에서 사용할 수 있는 이름
+MIDDLEWARES: dict[str, type] = {
+    "cors": CORSMiddleware,
+    "compression": CompressionMiddleware,
+}
+
+
+def add_middlewares(app: Starlette, order: Iterable[str], options: Mapping[str, Mapping[str, Any] | None]) -> list[str]:
+    """
+    order 순서대로 미들웨어를 등록하는 함수.
+    앞에 있을수록 바깥쪽 레이어(요청을 먼저 받고 응답을 마지막에 처리)입니다.
+
+    :param app: 애플리케이션
+    :param order: 미들웨어 이름 목록 (바깥 → 안쪽)
+    :param options: 미들웨어별 생성 인자, 없거나 None이면 비활성으로 보고 건너뜀
+    :return: 등록된 미들웨어 이름 목록 (바깥 → 안쪽)
+    """
+    order = list(order)
+    unknown = [name for name in order if name not in MIDDLEWARES]
+    if unknown:
+        raise ValueError(f"Unknown middleware: {unknown} (expected one of {tuple(MIDDLEWARES)})")
+
+    enabled = [name for name in order if options.get(name) is not None]
+    # add_middleware는 나중에 추가한 것이 바깥쪽이 되므로 역순으로 등록합니다.
+    for name in reversed(enabled):
+        app.add_middleware(MIDDLEWARES[name], **options[name])
+
+    logger.info(f"Middleware stack: {' -> '.join(enabled) or '(none)'}")
+    return enabled
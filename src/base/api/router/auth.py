@@ -1,12 +1,14 @@
 import datetime
 import logging
+import math
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
 
 from base.config import settings
 from base.utils.auth import create_access_token, decode_access_token, validate_client_credentials
+from base.utils.ratelimit import LoadShedder, MemoryBackend, RateLimiter, SqliteBackend
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +22,69 @@ router = APIRouter(
 )
 
 
+rate_limit = settings.app.rate_limit
+rate_limit_backend = SqliteBackend(rate_limit.database) if rate_limit.backend == "sqlite" else MemoryBackend()
+token_ip_limiter = RateLimiter(rate_limit_backend, rate_limit.token_ip.rate, rate_limit.token_ip.burst, "token:ip:")
+token_client_limiter = RateLimiter(
+    rate_limit_backend, rate_limit.token_client.rate, rate_limit.token_client.burst, "token:client:"
+)
+client_limiter = RateLimiter(rate_limit_backend, rate_limit.client.rate, rate_limit.client.burst, "client:")
+token_shedder = LoadShedder(rate_limit.token_max_concurrent)
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
 
 
-def get_current_client_id(token: str = Depends(oauth2_scheme)) -> str:
+async def _check_rate_limit(limiter: RateLimiter, key: str) -> None:
+    retry_after = await limiter.hit_async(key)
+    if retry_after > 0:
+        logger.warning(f"Rate limited: {limiter.prefix}{key}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+async def limit_token_request(request: Request, username: str = Form()) -> None:
+    """
+    토큰 발급 요청을 IP와 client_id(username) 단위로 제한하는 의존성 함수.
+    bcrypt 검증(validate_client_credentials)이 시작되기 전에 429로 거부합니다.
+    async 함수이고 동기 클래스 의존성(OAuth2PasswordRequestForm) 대신 Form 필드를 받으므로,
+    스레드풀 슬롯을 기다리지 않고 이벤트 루프에서 바로 판단합니다.
+    """
+    if not rate_limit.enabled:
+        return
+
+    await _check_rate_limit(token_ip_limiter, request.client.host if request.client else "unknown")
+    await _check_rate_limit(token_client_limiter, username)
+
+
+async def shed_token_load():
+    """
+    동시에 진행 중인 토큰 발급(bcrypt) 수를 제한하는 의존성 함수.
+    한도를 넘으면 스레드풀에 쌓이지 않도록 즉시 503과 Retry-After로 응답합니다.
+    async 함수이므로 판단 자체가 스레드풀 대기열(보호하려는 작업과 같은 대기열) 뒤에 서지 않습니다.
+    """
+    if not rate_limit.enabled:
+        yield
+        return
+
+    if not token_shedder.try_acquire():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy",
+            headers={"Retry-After": str(rate_limit.retry_after)},
+        )
+    try:
+        yield
+    finally:
+        token_shedder.release()
+
+
+async def get_current_client_id(token: str = Depends(oauth2_scheme)) -> str:
     """
     Dependency to decode and validate the access token.
     액세스 토큰을 디코딩하고 검증하는 의존성 함수.
@@ -39,7 +98,17 @@ def get_current_client_id(token: str = Depends(oauth2_scheme)) -> str:
     return decode_access_token(token=token)
 
 
-@router.post("/token", response_model=Token)
+async def get_limited_client_id(client_id: str = Depends(get_current_client_id)) -> str:
+    """
+    get_current_client_id에 client_id 단위 요청 제한을 더한 의존성 함수.
+    보호된 엔드포인트에서 get_current_client_id 대신 주입합니다.
+    """
+    if rate_limit.enabled:
+        await _check_rate_limit(client_limiter, client_id)
+    return client_id
+
+
+@router.post("/token", response_model=Token, dependencies=[Depends(limit_token_request), Depends(shed_token_load)])
 def issue_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     """
     클라이언트 자격증명(Client Credentials)을 확인하고 액세스 토큰을 발급합니다.
@@ -73,7 +142,7 @@ def issue_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
 
 @router.get("/me", response_model=dict)
 def read_current_client_info(
-    current_client_id: str = Depends(get_current_client_id),
+    current_client_id: str = Depends(get_limited_client_id),
 ):
     """
     Retrieves information for the currently authenticated client.
@@ -2,6 +2,8 @@ import logging
 from fastapi import APIRouter, Request, status
 from fastapi.responses import JSONResponse
 from base.config import settings
+from base.utils.common import get_hostname, get_pid, get_proc_listen_port
+from base.utils.process import get_listen_ports, get_process_stats, get_worker_pids, is_procfs_available
 
 logger = logging.getLogger(__name__)
 
@@ -16,3 +18,23 @@ router = APIRouter(
 async def setting(request: Request):
     config = settings.app.model_dump_json(indent=2)
     return JSONResponse(content=config)
+
+
+@router.get("/process", status_code=status.HTTP_200_OK)
+def process():
+    """
+    현재 워커와 같은 uvicorn 매니저에 속한 워커들의 리슨 포트, CPU, RSS 정보를 반환합니다.
+    Linux에서는 /proc만 읽으므로(외부 명령 미실행) 모니터링에서 주기적으로 호출해도 부담이 적습니다.
+    """
+    pid = get_pid()
+    if not is_procfs_available():
+        return {"hostname": get_hostname(), "pid": pid, "workers": [{"pid": pid, "ports": get_proc_listen_port(pid)}]}
+
+    workers = []
+    for worker_pid in get_worker_pids(pid):
+        try:
+            workers.append({**get_process_stats(worker_pid), "ports": get_listen_ports(worker_pid)})
+        except (FileNotFoundError, ProcessLookupError):  # 조회 도중 종료된 워커
+            continue
+
+    return {"hostname": get_hostname(), "pid": pid, "workers": workers}
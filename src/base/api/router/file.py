@@ -0,0 +1,290 @@
+import asyncio
+import fcntl
+import logging
+import os
+import threading
+import weakref
+from io import BufferedRandom
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Request, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from pydantic import BaseModel
+from sqlalchemy import and_
+
+from base.api.router.auth import get_limited_client_id
+from base.config import settings
+from base.model.orm import UploadSession
+from base.utils.common import append_chunks_to_file, uuid4
+from base.utils.sqlite import SqliteManager
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/file",
+    tags=["File"],
+    responses={404: {"description": "Not found"}},
+)
+
+# job 큐와 같은 SQLite 파일을 사용하므로 busy timeout 동안 이벤트 루프를 막지 않도록 DB 접근은 스레드에서 실행하고,
+# 공유 세션은 _db_lock으로 직렬화합니다. 핸들러가 받는 UploadSession은 세션에서 분리되어 속성 접근 시 DB를 조회하지 않습니다.
+upload_db = SqliteManager(settings.app.database)
+upload_db.create_table(UploadSession)
+_db_lock = threading.Lock()
+
+# 같은 업로드에 대한 PATCH 요청을 직렬화하는 잠금 (사용 중인 잠금만 유지)
+_upload_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+class UploadCreate(BaseModel):
+    filename: str
+    size: int | None = None
+
+
+class UploadState(BaseModel):
+    upload_id: str
+    filename: str
+    size: int | None
+    offset: int
+    status: str
+
+
+def _to_state(upload: UploadSession) -> UploadState:
+    return UploadState(
+        upload_id=upload.id, filename=upload.filename, size=upload.size, offset=upload.offset, status=upload.status
+    )
+
+
+def _state_headers(upload: UploadSession) -> dict[str, str]:
+    headers = {"Upload-Offset": str(upload.offset), "Cache-Control": "no-store"}
+    if upload.size is not None:
+        headers["Upload-Length"] = str(upload.size)
+    return headers
+
+
+def _part_path(upload_id: str) -> Path:
+    return settings.app.file.dir / f"{upload_id}.part"
+
+
+def _file_path(upload_id: str) -> Path:
+    return settings.app.file.dir / upload_id
+
+
+def _load(upload_id: str) -> UploadSession | None:
+    with _db_lock:
+        upload = upload_db.get(UploadSession, upload_id)
+        if upload is not None:
+            upload_db.session.expunge(upload)
+        return upload
+
+
+def _save(upload: UploadSession) -> None:
+    with _db_lock:
+        upload_db.insert(upload)
+        upload_db.session.refresh(upload)
+        upload_db.session.expunge(upload)
+
+
+def _update(stmt, data: dict) -> int:
+    with _db_lock:
+        return upload_db.update(UploadSession, stmt, data)
+
+
+async def _get_upload(upload_id: str, client_id: str) -> UploadSession:
+    upload = await run_in_threadpool(_load, upload_id)
+    if upload is None or upload.client_id != client_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    return upload
+
+
+def _check_size(size: int | None) -> None:
+    max_size = settings.app.file.max_size
+    if max_size and size is not None and size > max_size:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=f"Exceeded max size({max_size})")
+
+
+def _upload_lock(upload_id: str) -> asyncio.Lock:
+    lock = _upload_locks.get(upload_id)
+    if lock is None:
+        lock = _upload_locks[upload_id] = asyncio.Lock()
+    return lock
+
+
+def _open_part(upload_id: str) -> BufferedRandom:
+    """
+    .part 파일을 열고 배타적 잠금(flock)을 잡는 함수.
+    워커(프로세스) 간에도 같은 업로드에 대한 기록이 겹치지 않도록 하며, 파일을 닫으면 잠금이 해제됩니다.
+    """
+    f = open(_part_path(upload_id), "r+b")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX)
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+
+def _truncate(f: BufferedRandom, offset: int) -> None:
+    f.seek(offset)
+    f.truncate()
+
+
+def _complete(upload: UploadSession) -> None:
+    os.replace(_part_path(upload.id), _file_path(upload.id))
+    _update(UploadSession.id == upload.id, {"size": upload.offset, "status": "completed"})
+    upload.size, upload.status = upload.offset, "completed"
+    logger.info(f"Upload completed: {upload.id}({upload.filename}, {upload.offset} bytes)")
+
+
+@router.post("", response_model=UploadState, status_code=status.HTTP_201_CREATED)
+async def upload_file(
+    file: UploadFile = File(...),
+    current_client_id: str = Depends(get_limited_client_id),
+):
+    """
+    multipart/form-data 파일을 한 번에 업로드합니다.
+    본문은 Starlette가 임시 파일로 스풀링하며, 청크 단위로 저장소에 복사되어 메모리에 전체가 올라가지 않습니다.
+    """
+    _check_size(file.size)
+
+    upload_id = uuid4().hex
+    upload = UploadSession(id=upload_id, client_id=current_client_id, filename=file.filename or upload_id)
+    chunk_size = settings.app.file.chunk_size
+    chunks = iter(lambda: file.file.read(chunk_size), b"")
+    upload.offset = await run_in_threadpool(append_chunks_to_file, chunks, str(_part_path(upload_id)))
+
+    await run_in_threadpool(_save, upload)
+    await run_in_threadpool(_complete, upload)
+    return _to_state(upload)
+
+
+@router.post("/uploads", response_model=UploadState, status_code=status.HTTP_201_CREATED)
+async def create_upload(body: UploadCreate, current_client_id: str = Depends(get_limited_client_id)):
+    """
+    재개 가능한 업로드 세션을 생성합니다.
+    이후 PATCH /file/uploads/{upload_id} 로 Upload-Offset 헤더와 함께 원시(raw) 본문을 이어서 전송합니다.
+    size를 생략하면(크기를 미리 모르는 경우) 이후 PATCH의 Upload-Length 헤더로 전체 크기를 알려야 완료됩니다.
+    """
+    _check_size(body.size)
+
+    upload_id = uuid4().hex
+    _part_path(upload_id).touch()
+    upload = UploadSession(
+        id=upload_id, client_id=current_client_id, filename=body.filename, size=body.size, offset=0, status="pending"
+    )
+    await run_in_threadpool(_save, upload)
+    return _to_state(upload)
+
+
+@router.head("/uploads/{upload_id}")
+async def head_upload(upload_id: str, current_client_id: str = Depends(get_limited_client_id)):
+    """업로드 진행 상태를 헤더(Upload-Offset, Upload-Length)로만 반환합니다."""
+    upload = await _get_upload(upload_id, current_client_id)
+    return Response(status_code=status.HTTP_200_OK, headers=_state_headers(upload))
+
+
+@router.get("/uploads/{upload_id}", response_model=UploadState)
+async def get_upload(upload_id: str, response: Response, current_client_id: str = Depends(get_limited_client_id)):
+    """업로드 진행 상태를 반환합니다."""
+    upload = await _get_upload(upload_id, current_client_id)
+    response.headers.update(_state_headers(upload))
+    return _to_state(upload)
+
+
+@router.patch("/uploads/{upload_id}", response_model=UploadState)
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(..., alias="Upload-Offset"),
+    upload_length: int | None = Header(None, alias="Upload-Length"),
+    current_client_id: str = Depends(get_limited_client_id),
+):
+    """
+    업로드 세션에 원시(raw) 본문을 이어서 기록합니다.
+    Upload-Offset 헤더는 서버에 저장된 offset과 일치해야 하며, 불일치 시 409를 반환합니다.
+    크기 없이 생성한 업로드는 Upload-Length 헤더로 전체 크기를 확정하며(tus deferred length), offset이 도달하면 완료됩니다.
+    연결이 끊어지면 그때까지 기록된 바이트까지만 offset에 반영되어 다음 요청에서 이어서 전송할 수 있습니다.
+    """
+    upload = await _get_upload(upload_id, current_client_id)
+
+    # 워커 내부에서는 asyncio.Lock으로, 워커 간에는 .part 파일 잠금으로 같은 업로드의 기록을 직렬화하고,
+    # offset은 기대한 값일 때만 갱신(조건부 UPDATE)하여 동시에 들어온 요청이 서로의 데이터를 덮어쓰지 않게 합니다.
+    async with _upload_lock(upload_id):
+        try:
+            f = await run_in_threadpool(_open_part, upload_id)
+        except FileNotFoundError:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Upload already completed")
+
+        try:
+            # 다른 워커가 갱신했을 수 있으므로 잠금을 잡은 뒤 다시 읽습니다.
+            upload = await _get_upload(upload_id, current_client_id)
+            if upload.status == "completed":
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Upload already completed")
+            if upload_offset != upload.offset:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Offset mismatch (expected {upload.offset})",
+                    headers=_state_headers(upload),
+                )
+            size = upload.size
+            if upload_length is not None and upload_length != size:
+                if size is not None or upload_length < upload.offset:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Upload-Length")
+                _check_size(upload_length)
+                size = upload_length
+
+            limit = size if size is not None else settings.app.file.max_size or None
+            expected = offset = upload.offset
+            try:
+                await run_in_threadpool(_truncate, f, offset)
+                async for chunk in request.stream():
+                    if limit is not None and offset + len(chunk) > limit:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail="Exceeded upload size"
+                        )
+                    offset += await run_in_threadpool(f.write, chunk)
+                await run_in_threadpool(f.flush)
+            finally:
+                # 중간에 실패하더라도 디스크에 기록된 위치까지는 offset을 확정합니다.
+                updated = await run_in_threadpool(
+                    _update,
+                    and_(UploadSession.id == upload_id, UploadSession.offset == expected),
+                    {"offset": offset, "size": size},
+                )
+            if not updated:
+                upload = await _get_upload(upload_id, current_client_id)
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Upload offset changed concurrently",
+                    headers=_state_headers(upload),
+                )
+            upload.offset, upload.size = offset, size
+
+            if upload.size is not None and upload.offset == upload.size:
+                await run_in_threadpool(_complete, upload)
+        finally:
+            await run_in_threadpool(f.close)
+
+    response.headers.update(_state_headers(upload))
+    return _to_state(upload)
+
+
+@router.get("/{upload_id}")
+async def download_file(upload_id: str, current_client_id: str = Depends(get_limited_client_id)):
+    """
+    완료된 업로드 파일을 내려받습니다.
+    FileResponse가 Range/If-Range 요청(206, multipart/byteranges)을 처리하며,
+    zero-copy(sendfile) 전송은 ASGI 서버가 http.response.pathsend 확장을 지원할 때만 이루어집니다.
+    기본 실행 서버인 uvicorn은 이 확장을 지원하지 않으므로, 파일을 청크 단위로 읽어 Python에서 전송합니다.
+    """
+    upload = await _get_upload(upload_id, current_client_id)
+    if upload.status != "completed":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Upload not completed")
+
+    return FileResponse(
+        _file_path(upload_id),
+        filename=upload.filename,
+        headers={"Cache-Control": "private, no-cache"},
+    )
@@ -0,0 +1,32 @@
+import logging
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/live", status_code=status.HTTP_200_OK)
+async def live():
+    """프로세스가 요청을 처리할 수 있는지(liveness) 확인합니다. 의존성 없이 즉시 응답합니다."""
+    return {"status": "alive"}
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+async def ready(request: Request):
+    """
+    워밍업이 끝나 트래픽을 받을 준비가 되었는지(readiness) 확인합니다.
+    필수 워밍업 단계(DB 연결)가 실패했거나 종료 신호를 받아 drain 중이면 503을 반환하여 로드밸런서가 라우팅하지 않도록 합니다.
+    """
+    state = request.app.state
+    if getattr(state, "draining", False):
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "draining"})
+    if not getattr(state, "ready", False):
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "not ready"})
+    return {"status": "ready"}
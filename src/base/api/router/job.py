@@ -0,0 +1,96 @@
+import datetime
+import logging
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
+from base.api.router.auth import get_limited_client_id
+from base.config import settings
+from base.core.jobs import JobQueue
+from base.utils.common import post_http_api
+from base.utils.sqlite import SqliteManager
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/job",
+    tags=["Job"],
+    responses={404: {"description": "Not found"}},
+)
+
+jobs = JobQueue(
+    SqliteManager(settings.app.database),
+    queues=settings.app.job.queues,
+    concurrency=settings.app.job.concurrency,
+    executor=settings.app.job.executor,
+    workers=settings.app.job.workers,
+    poll_interval=settings.app.job.poll_interval,
+    lease_seconds=settings.app.job.lease_seconds,
+    retry_backoff=settings.app.job.retry_backoff,
+)
+
+
+def post_http_job(url: str, uri: str, headers: dict[str, str] | None = None, body: dict[str, Any] | None = None) -> Any:
+    """
+    응답 대기 시간(job.http_timeout)을 적용한 post_http_api 작업.
+    실행 중인 작업은 heartbeat가 점유 기한을 계속 연장하고 스레드는 중단할 수 없으므로,
+    응답 없는 대상이 http 큐 슬롯을 영구히 차지하거나 종료 후에도 요청이 남아 중복 전송되지 않도록 요청 시간을 제한합니다.
+    (process executor에서도 pickle할 수 있도록 모듈 최상위 함수로 둡니다)
+    """
+    return post_http_api(url, uri, headers=headers, body=body, timeout=settings.app.job.http_timeout)
+
+
+jobs.task("http.post", queue="http", max_attempts=3)(post_http_job)
+
+
+class HttpPostJob(BaseModel):
+    url: str
+    uri: str
+    headers: dict[str, str] | None = None
+    body: dict[str, Any] | None = None
+
+
+class JobCreated(BaseModel):
+    job_id: str
+
+
+class JobState(BaseModel):
+    job_id: str
+    queue: str
+    name: str
+    status: str
+    attempts: int
+    max_attempts: int
+    result: Any | None
+    error: str | None
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+@router.post("/http", status_code=status.HTTP_202_ACCEPTED, response_model=JobCreated)
+async def enqueue_http_post(job: HttpPostJob, current_client_id: str = Depends(get_limited_client_id)):
+    """
+    외부 API 호출(post_http_api)을 백그라운드 작업으로 등록합니다. 결과는 /job/{job_id}로 조회합니다.
+    서버가 임의의 내부망/메타데이터 주소로 요청을 중계하지 않도록 url은 job.http_allowed_hosts에 등록된 대상만 허용합니다.
+    """
+    # uri가 '/'로 시작하지 않으면 'http://{url}{uri}'에서 호스트가 바뀔 수 있습니다. (예: '@evil.com/')
+    if job.url not in settings.app.job.http_allowed_hosts or not job.uri.startswith("/"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Target not allowed")
+    job_id = await jobs.enqueue_async("http.post", job.model_dump(), client_id=current_client_id)
+    return JobCreated(job_id=job_id)
+
+
+@router.get("/stats", status_code=status.HTTP_200_OK)
+async def stats(current_client_id: str = Depends(get_limited_client_id)):
+    """큐별 작업 상태 건수와 현재 워커에서 실행 중인 작업 수를 반환합니다."""
+    return await run_in_threadpool(jobs.stats)
+
+
+@router.get("/{job_id}", status_code=status.HTTP_200_OK, response_model=JobState)
+async def get_job(job_id: str, current_client_id: str = Depends(get_limited_client_id)):
+    job = await run_in_threadpool(jobs.get, job_id)
+    if job is None or job["client_id"] != current_client_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return JobState(job_id=job["id"], **{k: v for k, v in job.items() if k in JobState.model_fields})
@@ -0,0 +1,99 @@
+import logging
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from pydantic import BaseModel, Field, ValidationError
+
+from base.api.router.auth import get_limited_client_id
+from base.config import settings
+from base.core.hub import Hub
+from base.model.data import Message
+from base.utils.auth import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/ws",
+    tags=["WebSocket"],
+    responses={404: {"description": "Not found"}},
+)
+
+hub = Hub(queue_size=settings.app.websocket.queue_size, drop_policy=settings.app.websocket.drop_policy)
+
+
+class Command(BaseModel):
+    """클라이언트가 WebSocket으로 보내는 명령."""
+
+    action: Literal["subscribe", "unsubscribe", "publish"]
+    topic: str = "default"
+    event: str = "on_message"
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
+def _authenticate(websocket: WebSocket, token: str | None) -> str | None:
+    """쿼리 파라미터(token) 또는 Authorization 헤더의 Bearer 토큰으로 client_id를 확인합니다."""
+    if not token:
+        scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else None
+    if not token:
+        return None
+
+    try:
+        return decode_access_token(token=token)
+    except HTTPException:
+        return None
+
+
+@router.websocket("")
+async def websocket_endpoint(websocket: WebSocket, token: str | None = Query(None)):
+    """
+    실시간 메시지 채널.
+    연결 후 {"action": "subscribe", "topic": "..."} 로 구독하고,
+    {"action": "publish", "topic": "...", "data": {...}} 로 해당 토픽 구독자 전체에게 Message를 브로드캐스트합니다.
+    """
+    client_id = _authenticate(websocket, token)
+    if client_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscriber = hub.connect(websocket, client_id)
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("text") is None:
+                # receive_text()는 바이너리 프레임에서 KeyError를 내므로 직접 받아 오류 메시지로 응답합니다.
+                subscriber.offer(
+                    Message(event="error", data={"detail": "Binary frames are not supported"}).model_dump_json()
+                )
+                continue
+            try:
+                command = Command.model_validate_json(message["text"])
+            except ValidationError as e:
+                subscriber.offer(Message(event="error", data={"detail": e.errors(include_url=False)}).model_dump_json())
+                continue
+
+            if command.action == "subscribe":
+                hub.subscribe(subscriber, command.topic)
+            elif command.action == "unsubscribe":
+                hub.unsubscribe(subscriber, command.topic)
+            else:
+                hub.publish(Message(event=command.event, topic=command.topic, data=command.data))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await hub.disconnect(subscriber)
+
+
+@router.post("/publish", status_code=status.HTTP_200_OK)
+async def publish(message: Message, current_client_id: str = Depends(get_limited_client_id)):
+    """서버 측에서 토픽 구독자에게 메시지를 브로드캐스트합니다."""
+    return {"topic": message.topic, "delivered": hub.publish(message)}
+
+
+@router.get("/stats", status_code=status.HTTP_200_OK)
+async def stats(current_client_id: str = Depends(get_limited_client_id)):
+    """현재 워커의 연결/토픽/대기열 통계를 반환합니다."""
+    return hub.stats()
@@ -0,0 +1,161 @@
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+from pathlib import Path
+
+from fastapi import HTTPException
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+from base.utils.common import select_encoding
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency (pip install base[compress])
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 이미 압축된 포맷(이미지, 폰트 등)은 다시 압축해도 이득이 없으므로 제외합니다.
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "application/wasm",
+    "image/svg+xml",
+)
+IMMUTABLE_CACHE_CONTROL = "public, max-age={max_age}, immutable"
+
+
+def _compress_gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _compress_br(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+# 서버 선호 순서 (q값이 같으면 앞쪽 인코딩이 선택됨)
+ENCODERS = {"br": (".br", _compress_br), "gzip": (".gz", _compress_gzip)}
+
+
+class StaticAsset:
+    """지문(fingerprint)이 붙은 정적 파일 하나와 사전 압축된 변형(variant)들."""
+
+    __slots__ = ("path", "stat_result", "media_type", "digest", "variants")
+
+    def __init__(self, path: Path, media_type: str, digest: str):
+        self.path = path
+        self.stat_result = os.stat(path)
+        self.media_type = media_type
+        self.digest = digest
+        self.variants: dict[str, tuple[Path, os.stat_result]] = {}
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    정적 파일을 콘텐츠 해시로 지문 처리하고, 시작 시점에 .br/.gz 변형을 생성해 제공하는 StaticFiles.
+
+    - 지문 경로(`css/main.3f2a1b9c0d.css`)는 내용이 바뀌면 URL도 바뀌므로 immutable 캐시 헤더로 응답합니다.
+    - Accept-Encoding에 따라 가장 적합한 사전 압축 변형을 그대로 전송합니다. (요청마다 압축하지 않음)
+    - 지문이 없는 원본 경로는 기존 StaticFiles 동작(ETag/Last-Modified 재검증)을 그대로 따릅니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | os.PathLike,
+        build_dir: str | os.PathLike,
+        prefix: str = "/static",
+        min_size: int = 256,
+        max_age: int = 31536000,
+        **kwargs,
+    ):
+        super().__init__(directory=directory, **kwargs)
+        self.source_dir = Path(directory)
+        self.build_dir = Path(build_dir)
+        self.prefix = prefix.rstrip("/")
+        self.min_size = min_size
+        self.cache_control = IMMUTABLE_CACHE_CONTROL.format(max_age=max_age)
+        self.manifest: dict[str, str] = {}  # 원본 경로 -> 지문 경로
+        self.assets: dict[str, StaticAsset] = {}  # 지문 경로 -> StaticAsset
+        self.build()
+
+    def build(self) -> None:
+        """정적 디렉토리를 순회하며 지문 경로를 계산하고 압축 변형을 생성합니다. (이미 생성된 변형은 재사용)"""
+        manifest: dict[str, str] = {}
+        assets: dict[str, StaticAsset] = {}
+
+        for path in sorted(self.source_dir.rglob("*")):
+            relative = path.relative_to(self.source_dir)
+            if not path.is_file() or any(part.startswith(".") for part in relative.parts):
+                continue
+
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()[:10]
+            fingerprinted = relative.with_name(f"{relative.stem}.{digest}{relative.suffix}").as_posix()
+            media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+            asset = StaticAsset(path, media_type, digest)
+            if len(data) >= self.min_size and media_type.startswith(COMPRESSIBLE_TYPES):
+                for encoding, (suffix, compress) in ENCODERS.items():
+                    if encoding == "br" and brotli is None:
+                        continue
+                    variant = self._build_variant(self.build_dir / f"{fingerprinted}{suffix}", data, compress)
+                    if variant is not None:
+                        asset.variants[encoding] = (variant, os.stat(variant))
+
+            manifest[relative.as_posix()] = fingerprinted
+            assets[fingerprinted] = asset
+
+        self.manifest, self.assets = manifest, assets
+        logger.info(f"Built {len(assets)} static assets into {self.build_dir}")
+
+    @staticmethod
+    def _build_variant(target: Path, data: bytes, compress) -> Path | None:
+        if not target.exists():
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                return None
+            # 여러 워커가 동시에 생성해도 안전하도록 임시 파일에 쓴 뒤 교체합니다.
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(compressed)
+            os.replace(tmp, target)
+        return target
+
+    def url(self, path: str) -> str:
+        """템플릿용 헬퍼: 원본 경로를 지문 경로 URL로 변환합니다. (매니페스트에 없으면 원본 경로)"""
+        path = path.lstrip("/")
+        return f"{self.prefix}/{self.manifest.get(path, path)}"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        asset = self.assets.get(Path(path).as_posix())
+        if asset is None:
+            return await super().get_response(path, scope)
+
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+
+        request_headers = Headers(scope=scope)
+        encoding = select_encoding(request_headers.get("accept-encoding", ""), asset.variants)
+        headers = {"Cache-Control": self.cache_control, "Vary": "Accept-Encoding"}
+        if encoding is None:
+            full_path, stat_result = asset.path, asset.stat_result
+            headers["ETag"] = f'"{asset.digest}"'
+        else:
+            full_path, stat_result = asset.variants[encoding]
+            headers["ETag"] = f'"{asset.digest}-{encoding}"'
+            headers["Content-Encoding"] = encoding
+
+        response = FileResponse(full_path, headers=headers, media_type=asset.media_type, stat_result=stat_result)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
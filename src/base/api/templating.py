@@ -0,0 +1,130 @@
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+import jinja2
+import jinja2.meta
+from fastapi import Request
+from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+
+class CachedJinja2Templates(Jinja2Templates):
+    """
+    바이트코드 캐시와 렌더링 결과 캐시를 지원하는 Jinja2Templates.
+
+    - cache_dir: 컴파일된 템플릿 바이트코드를 디스크에 저장하여, 워커 재시작 시 파싱/컴파일 단계를 생략합니다.
+    - cacheable: 렌더링 결과가 request에 의존하지 않는 템플릿 목록입니다.
+      CachedTemplateResponse로 렌더링하면 (템플릿, context) 단위로 결과 바이트를 재사용하며,
+      템플릿 파일이나 extends/include/import로 참조하는 템플릿이 변경되면(mtime) 해당 항목을 다시 렌더링합니다.
+      참조 이름이 변수라서 의존 템플릿을 알 수 없으면 캐시하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        cache_dir: str | os.PathLike | None = None,
+        cacheable: Iterable[str] = (),
+        maxsize: int = 128,
+    ):
+        bytecode_cache = None
+        if cache_dir is not None:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = jinja2.FileSystemBytecodeCache(str(cache_dir))
+
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(directory),
+            autoescape=jinja2.select_autoescape(),
+            bytecode_cache=bytecode_cache,
+            auto_reload=True,
+        )
+        super().__init__(env=env)
+
+        self.cacheable = set(cacheable)
+        self.maxsize = maxsize
+        self._render_cache: OrderedDict[tuple, tuple[list[jinja2.Template], bytes]] = OrderedDict()
+
+    def precompile(self) -> list[str]:
+        """모든 템플릿을 미리 로드(컴파일)하여 바이트코드 캐시를 채웁니다."""
+        names = self.env.list_templates()
+        for name in names:
+            self.env.get_template(name)
+        return names
+
+    def clear_render_cache(self) -> None:
+        self._render_cache.clear()
+
+    def _dependencies(self, name: str) -> list[jinja2.Template] | None:
+        """
+        name 템플릿과 extends/include/import로 참조하는 템플릿을 재귀적으로 모읍니다.
+
+        :param name: 템플릿 이름
+        :return: name 템플릿이 첫 번째인 템플릿 리스트, 참조 대상을 정적으로 알 수 없으면 None
+        """
+        templates: dict[str, jinja2.Template] = {}
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            if current in templates:
+                continue
+            try:
+                templates[current] = self.get_template(current)
+            except jinja2.TemplateNotFound:
+                # 없는 템플릿을 참조하면(include ... ignore missing) 나중에 생겨도 감지할 수 없으므로 캐시하지 않습니다.
+                if current == name:
+                    raise
+                return None
+            source, _, _ = self.env.loader.get_source(self.env, current)
+            for referenced in jinja2.meta.find_referenced_templates(self.env.parse(source)):
+                if referenced is None:
+                    return None
+                pending.append(referenced)
+        return list(templates.values())
+
+    def CachedTemplateResponse(
+        self,
+        request: Request,
+        name: str,
+        context: dict[str, Any] | None = None,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> Response:
+        """
+        cacheable 템플릿이면 캐시된 렌더링 결과로, 아니면 일반 TemplateResponse로 응답합니다.
+        캐시 키에는 request를 제외한 context가 사용되므로 context 값은 해시 가능해야 합니다.
+        """
+        context = context or {}
+        if name not in self.cacheable:
+            return self.TemplateResponse(request, name, context, status_code, headers, media_type, background)
+
+        try:
+            key = (name, frozenset(context.items()))
+            entry = self._render_cache.get(key)
+        except TypeError:
+            logger.debug(f"Unhashable context for '{name}', rendering without cache")
+            return self.TemplateResponse(request, name, context, status_code, headers, media_type, background)
+
+        if entry is None or not all(template.is_up_to_date for template in entry[0]):
+            templates = self._dependencies(name)
+            if templates is None:
+                logger.debug(f"Dynamic template reference in '{name}', rendering without cache")
+                self._render_cache.pop(key, None)
+                return self.TemplateResponse(request, name, context, status_code, headers, media_type, background)
+            content = templates[0].render({**context, "request": request}).encode("utf-8")
+            entry = (templates, content)
+            self._render_cache[key] = entry
+            if len(self._render_cache) > self.maxsize:
+                self._render_cache.popitem(last=False)
+        else:
+            self._render_cache.move_to_end(key)
+
+        return HTMLResponse(entry[1], status_code, headers, media_type, background)
@@ -14,8 +14,42 @@ class AuthConfig(BaseModel):
     root_password: str
 
 
+class CompressionConfig(BaseModel):
+    enabled: bool = True
+    minimum_size: int = 1024  # 이보다 작은 본문은 압축하지 않음
+    levels: dict[str, int] = {"zstd": 3, "br": 4, "gzip": 6}  # 키 순서 = 서버 선호 순서
+    excluded_types: list[str] = [
+        "image/",
+        "video/",
+        "audio/",
+        "font/woff",
+        "application/zip",
+        "application/gzip",
+        "application/x-gzip",
+        "application/octet-stream",
+        "text/event-stream",
+    ]
+
+
+class BucketConfig(BaseModel):
+    rate: float  # 초당 충전 토큰 수
+    burst: int  # 버킷 크기
+
+
+class RateLimitConfig(BaseModel):
+    enabled: bool = True
+    backend: str = "memory"  # memory: 워커 단위, sqlite: 워커 간 공유
+    database: Path = Field(Path(__file__).parent.parent.parent / ".cache" / "ratelimit.sqlite3")
+    token_ip: BucketConfig = BucketConfig(rate=1.0, burst=10)
+    token_client: BucketConfig = BucketConfig(rate=0.5, burst=5)
+    client: BucketConfig = BucketConfig(rate=20.0, burst=40)
+    token_max_concurrent: int = Field(default_factory=lambda: os.cpu_count() or 4)  # 0: 제한 없음
+    retry_after: int = 1  # 부하 차단(503) 시 Retry-After
+
+
 class EnvConfig(BaseModel):
     debug: bool
+    compression: CompressionConfig = Field(default_factory=CompressionConfig)
 
 
 class LoggerConfig(BaseModel):
@@ -23,12 +57,75 @@ class LoggerConfig(BaseModel):
     dir: Path = Field(Path(__file__).parent.parent.parent / "logs")
 
 
+class FileConfig(BaseModel):
+    dir: Path = Field(Path(__file__).parent.parent.parent / "uploads")
+    chunk_size: int = 1024 * 1024
+    max_size: int = 0  # 0: 제한 없음
+
+
+class StaticConfig(BaseModel):
+    build_dir: Path = Field(Path(__file__).parent.parent.parent / ".cache" / "static")
+    min_size: int = 256  # 이보다 작은 파일은 압축 변형을 만들지 않음
+    max_age: int = 31536000  # 지문 경로의 Cache-Control max-age (1년)
+
+
+class TemplateConfig(BaseModel):
+    cache_dir: Path = Field(Path(__file__).parent.parent.parent / ".cache" / "jinja2")
+    cacheable: list[str] = ["index.html"]  # request에 의존하지 않는 템플릿만 등록
+    render_cache_size: int = 128
+
+
+class WebSocketConfig(BaseModel):
+    queue_size: int = 256  # 연결별 송신 대기열 크기
+    drop_policy: str = "drop_oldest"  # drop_oldest | drop_newest | disconnect
+
+
+class HealthConfig(BaseModel):
+    drain_seconds: float = 5.0  # SIGTERM 후 readiness를 503으로 내린 채 종료를 미루는 시간(초)
+
+
+class CORSConfig(BaseModel):
+    allow_origins: list[str] = ["*"]
+    allow_methods: list[str] = ["*"]
+    allow_headers: list[str] = ["*"]
+    allow_credentials: bool = True
+    expose_headers: list[str] = []
+    max_age: int = 600  # preflight 응답 캐시 시간(초), Access-Control-Max-Age
+
+
+class MiddlewareConfig(BaseModel):
+    order: list[str] = ["cors", "compression"]  # 바깥 → 안쪽 순서
+    cors: CORSConfig = Field(default_factory=CORSConfig)
+
+
+class JobConfig(BaseModel):
+    enabled: bool = True  # false: 작업 등록만 하고 이 프로세스에서는 실행하지 않음
+    executor: str = "thread"  # thread | process (동기 태스크 실행 풀, 코루틴 태스크는 이벤트 루프에서 실행)
+    workers: int = Field(default_factory=lambda: os.cpu_count() or 4)  # 스레드/프로세스 풀 크기
+    concurrency: int = 4  # queues에 없는 큐의 동시 실행 수
+    queues: dict[str, int] = {"default": 4, "http": 8}  # 큐별 동시 실행 수
+    poll_interval: float = 1.0  # 다른 워커가 등록한 작업/재시도 작업 확인 주기(초)
+    lease_seconds: int = 300  # running 작업 점유 기한
+    retry_backoff: float = 1.0  # 재시도 대기 시간 = retry_backoff * 2^(attempts - 1)
+    http_allowed_hosts: list[str] = []  # POST /job/http 호출 허용 대상(host[:port]), 비어 있으면 모두 거부
+    http_timeout: float = 5.0  # POST /job/http 요청의 연결/응답 대기 시간(초)
+
+
 class AppConfig(BaseModel):
     name: str
     root: Path = Field(Path(__file__).parent.parent.parent)
+    database: str = Field(f"sqlite:///{Path(__file__).parent.parent.parent / 'db.sqlite3'}")
     auth: AuthConfig
     env: dict[str, EnvConfig]
     logger: LoggerConfig
+    file: FileConfig = Field(default_factory=FileConfig)
+    static: StaticConfig = Field(default_factory=StaticConfig)
+    template: TemplateConfig = Field(default_factory=TemplateConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    websocket: WebSocketConfig = Field(default_factory=WebSocketConfig)
+    health: HealthConfig = Field(default_factory=HealthConfig)
+    job: JobConfig = Field(default_factory=JobConfig)
+    middleware: MiddlewareConfig = Field(default_factory=MiddlewareConfig)
 
 
 class Settings:
@@ -41,6 +138,7 @@ class Settings:
         self.app = AppConfig(**yaml_data)
         self.env = self.app.env[env]
         self.app.logger.dir.mkdir(parents=True, exist_ok=True)
+        self.app.file.dir.mkdir(parents=True, exist_ok=True)
 
         if not self.app.auth.secret_key:
             self.app.auth.secret_key = os.urandom(32).hex()
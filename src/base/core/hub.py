@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import logging
+
+from fastapi import WebSocket, status
+
+from base.model.data import Message
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+
+class Subscriber:
+    """
+    WebSocket 연결 하나와 그 연결의 송신 대기열.
+    발행(publish)은 대기열에 넣기만 하고, 실제 전송은 연결별 송신 태스크가 담당하므로
+    느린 소비자가 다른 구독자로의 전송을 지연시키지 않습니다.
+    """
+
+    __slots__ = ("websocket", "client_id", "topics", "queue", "drop_policy", "dropped", "task", "closed")
+
+    def __init__(self, websocket: WebSocket, client_id: str, queue_size: int, drop_policy: str):
+        self.websocket = websocket
+        self.client_id = client_id
+        self.topics: set[str] = set()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self.task: asyncio.Task | None = None
+        self.closed = False
+
+    def offer(self, payload: str) -> bool:
+        """직렬화된 메시지를 송신 대기열에 넣습니다. 대기열이 가득 차면 drop_policy를 적용합니다."""
+        if self.closed:
+            return False
+
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+        if self.drop_policy == "drop_oldest":
+            self.queue.get_nowait()
+            self.queue.put_nowait(payload)
+            return True
+        if self.drop_policy == "disconnect":
+            self.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return False
+
+    async def run(self) -> None:
+        """송신 태스크: 대기열의 메시지를 순서대로 전송합니다."""
+        try:
+            while True:
+                await self.websocket.send_text(await self.queue.get())
+        except Exception as e:  # 이미 끊어진 연결
+            logger.debug(f"WebSocket send failed({self.client_id}): {e}")
+            self.closed = True
+
+    def close(self, code: int = status.WS_1000_NORMAL_CLOSURE) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        if self.task is not None:
+            self.task.cancel()
+        # 수신 루프가 websocket.disconnect를 받고 Hub.disconnect로 정리합니다.
+        asyncio.get_running_loop().create_task(self._close_websocket(code))
+
+    async def _close_websocket(self, code: int) -> None:
+        with contextlib.suppress(Exception):
+            await self.websocket.close(code=code)
+
+
+class Hub:
+    """
+    토픽 단위 WebSocket 브로드캐스트 허브.
+    메시지는 발행 시 한 번만 JSON으로 직렬화되어 모든 구독자의 송신 대기열로 전달됩니다.
+    """
+
+    def __init__(self, queue_size: int = 256, drop_policy: str = "drop_oldest"):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Invalid drop policy: {drop_policy} (expected one of {DROP_POLICIES})")
+
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.topics: dict[str, set[Subscriber]] = {}
+        self.subscribers: set[Subscriber] = set()
+
+    def connect(self, websocket: WebSocket, client_id: str) -> Subscriber:
+        """수락(accept)된 WebSocket을 등록하고 송신 태스크를 시작합니다."""
+        subscriber = Subscriber(websocket, client_id, self.queue_size, self.drop_policy)
+        subscriber.task = asyncio.get_running_loop().create_task(subscriber.run())
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    async def disconnect(self, subscriber: Subscriber) -> None:
+        """구독을 모두 해제하고 송신 태스크를 정리합니다."""
+        for topic in list(subscriber.topics):
+            self.unsubscribe(subscriber, topic)
+        self.subscribers.discard(subscriber)
+
+        subscriber.closed = True
+        if subscriber.task is not None:
+            subscriber.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await subscriber.task
+
+    def subscribe(self, subscriber: Subscriber, topic: str) -> None:
+        self.topics.setdefault(topic, set()).add(subscriber)
+        subscriber.topics.add(topic)
+
+    def unsubscribe(self, subscriber: Subscriber, topic: str) -> None:
+        subscribers = self.topics.get(topic)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self.topics[topic]
+        subscriber.topics.discard(topic)
+
+    def publish(self, message: Message) -> int:
+        """
+        메시지를 토픽 구독자에게 브로드캐스트합니다.
+
+        :param message: 발행할 메시지 (message.topic 기준으로 전달)
+        :return: 송신 대기열에 들어간 구독자 수
+        """
+        subscribers = self.topics.get(message.topic)
+        if not subscribers:
+            return 0
+
+        payload = message.model_dump_json()
+        return sum(subscriber.offer(payload) for subscriber in tuple(subscribers))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "connections": len(self.subscribers),
+            "topics": len(self.topics),
+            "queued": sum(s.queue.qsize() for s in self.subscribers),
+            "dropped": sum(s.dropped for s in self.subscribers),
+        }
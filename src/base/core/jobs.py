@@ -0,0 +1,347 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import datetime
+import functools
+import inspect
+import logging
+import threading
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, func, or_, select
+
+from base.model.orm import Job
+from base.utils.sqlite import SqliteManager
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("thread", "process")
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    func: Callable[..., Any]
+    queue: str
+    max_attempts: int
+
+
+class JobQueue:
+    """
+    SQLite에 영속화되는 백그라운드 작업 큐.
+
+    - enqueue는 작업을 job 테이블에 기록만 하고 즉시 반환하므로, 느린 작업이 요청을 붙잡지 않습니다.
+    - start() 이후 디스패처가 큐별 동시 실행 수(queues) 안에서 작업을 가져와 실행합니다.
+      코루틴 태스크는 이벤트 루프에서, 동기 태스크는 스레드/프로세스 풀(executor)에서 실행됩니다.
+    - 실패한 작업은 max_attempts까지 지수 백오프로 재시도합니다.
+    - 점유(claim)는 UPDATE 한 문장으로 이루어져 워커 간에도 원자적이며, 실행 중에는 heartbeat가 점유 기한을 연장합니다.
+      워커가 비정상 종료되거나 멈춰 heartbeat가 점유 기한(lease_seconds)을 넘기면 다른 워커가 작업을 다시 실행하므로,
+      실행 보장은 at-least-once입니다. (태스크는 다시 실행되어도 안전하도록 작성해야 합니다)
+    """
+
+    def __init__(
+        self,
+        db: SqliteManager,
+        queues: dict[str, int] | None = None,
+        concurrency: int = 4,
+        executor: str = "thread",
+        workers: int = 4,
+        poll_interval: float = 1.0,
+        lease_seconds: int = 300,
+        retry_backoff: float = 1.0,
+    ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Invalid executor: {executor} (expected one of {EXECUTORS})")
+
+        self.db = db
+        self.db.create_table(Job)
+        self.queues = dict(queues or {"default": concurrency})
+        self.concurrency = concurrency
+        self.executor = executor
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease = datetime.timedelta(seconds=lease_seconds)
+        self.retry_backoff = retry_backoff
+        self.tasks: dict[str, Task] = {}
+
+        # DB 접근은 busy timeout 동안 이벤트 루프를 막지 않도록 스레드에서 실행하며(asyncio.to_thread),
+        # 세션은 스레드 안전하지 않으므로 모든 DB 접근을 이 잠금으로 직렬화합니다.
+        self._lock = threading.Lock()
+        self._active: dict[str, int] = {}
+        self._running: set[asyncio.Task] = set()
+        self._leases: dict[str, str] = {}  # 실행 중인 작업 ID -> 점유 토큰
+        self._heartbeat_task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._pool: concurrent.futures.Executor | None = None
+
+    def task(self, name: str | None = None, queue: str = "default", max_attempts: int = 3):
+        """
+        @jobs.task("report.build", queue="default", max_attempts=5)
+        def build_report(report_id: str):
+            ...
+
+
+        jobs.enqueue("report.build", {"report_id": "..."})
+
+        - payload는 키워드 인자로 전달되므로 JSON으로 직렬화 가능해야 합니다.
+        - executor가 process이면 태스크는 모듈 최상위 함수여야 합니다. (pickle)
+        """
+
+        def decorator(func):
+            self.tasks[name or f"{func.__module__}.{func.__qualname__}"] = Task(func, queue, max_attempts)
+            self.queues.setdefault(queue, self.concurrency)
+            return func
+
+        return decorator
+
+    async def enqueue_async(
+        self, name: str, payload: dict[str, Any] | None = None, client_id: str | None = None, delay: float = 0
+    ) -> str:
+        """enqueue를 스레드에서 실행하는 비동기 버전. (async 엔드포인트용)"""
+        return await asyncio.to_thread(self.enqueue, name, payload, client_id, delay)
+
+    def enqueue(
+        self, name: str, payload: dict[str, Any] | None = None, client_id: str | None = None, delay: float = 0
+    ) -> str:
+        """
+        작업을 등록하는 함수.
+
+        :param name: 태스크 이름
+        :param payload: 태스크 키워드 인자
+        :param client_id: 작업을 등록한 클라이언트 (상태 조회 권한 확인용)
+        :param delay: 실행 지연 시간(초)
+        :return: 작업 ID
+        """
+        return self.enqueue_many(name, [payload or {}], client_id=client_id, delay=delay)[0]
+
+    def enqueue_many(
+        self,
+        name: str,
+        payloads: Iterable[dict[str, Any]],
+        client_id: str | None = None,
+        delay: float = 0,
+        batch: int = 500,
+    ) -> list[str]:
+        """여러 작업을 batch 단위 커밋으로 한 번에 등록하는 함수."""
+        task = self.tasks.get(name)
+        if task is None:
+            raise ValueError(f"Unknown task: {name}")
+
+        run_at = _utcnow() + datetime.timedelta(seconds=delay)
+        jobs = [
+            Job(
+                id=uuid.uuid4().hex,
+                queue=task.queue,
+                name=name,
+                payload=payload,
+                client_id=client_id,
+                max_attempts=task.max_attempts,
+                run_at=run_at,
+            )
+            for payload in payloads
+        ]
+        job_ids = [job.id for job in jobs]  # 커밋 후에는 속성이 만료되므로 미리 읽어 둡니다.
+        with self._lock:
+            self.db.insert(jobs, batch=batch)
+        self._notify()
+        return job_ids
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """작업 상태를 조회하는 함수. 다른 워커가 갱신했을 수 있으므로 항상 DB에서 다시 읽습니다."""
+        with self._lock:
+            self.db.session.expire_all()
+            job = self.db.get(Job, job_id)
+            if job is None:
+                return None
+            return {column.name: getattr(job, column.name) for column in Job.__table__.columns}
+
+    def stats(self) -> dict[str, Any]:
+        """큐별 상태 건수와 이 프로세스에서 실행 중인 작업 수를 반환하는 함수."""
+        with self._lock:
+            rows = self.db.session.execute(
+                select(Job.queue, Job.status, func.count()).group_by(Job.queue, Job.status)
+            ).all()
+            self.db.session.commit()
+
+        jobs: dict[str, dict[str, int]] = {}
+        for queue, status, count in rows:
+            jobs.setdefault(queue, {})[status] = count
+        return {"running": dict(self._active), "limits": dict(self.queues), "jobs": jobs}
+
+    async def start(self) -> None:
+        """디스패처와 실행 풀을 시작합니다. (lifespan 시작 시 호출)"""
+        if self._dispatcher is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        if self.executor == "process":
+            self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+        self._dispatcher = self._loop.create_task(self._dispatch())
+        self._heartbeat_task = self._loop.create_task(self._heartbeat())
+        logger.info(f"Job queue started ({self.executor} x {self.workers}, queues={self.queues})")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        새 작업 점유를 멈추고 실행 중인 작업을 timeout초까지 기다립니다. (lifespan 종료 시 호출)
+        시간 안에 끝나지 않은 작업은 다시 queued로 되돌려 다음 실행 시 이어서 처리합니다.
+        """
+        if self._dispatcher is None:
+            return
+
+        self._dispatcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._dispatcher
+        self._dispatcher = None
+
+        if self._running:
+            _, pending = await asyncio.wait(self._running, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        self._heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._heartbeat_task
+        self._heartbeat_task = None
+
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        logger.info("Job queue stopped")
+
+    def _notify(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            with contextlib.suppress(RuntimeError):  # 루프가 이미 종료된 경우
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._wakeup.clear()
+            claimed = 0
+            for queue, limit in self.queues.items():
+                free = limit - self._active.get(queue, 0)
+                if free <= 0:
+                    continue
+                try:
+                    jobs = await asyncio.to_thread(self._claim, queue, free)
+                except Exception as e:
+                    logger.error(f"Job claim failed({queue}): {e}")
+                    continue
+                for job in jobs:
+                    self._active[queue] = self._active.get(queue, 0) + 1
+                    self._leases[job[0]] = job[1]
+                    task = self._loop.create_task(self._run(*job))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+                claimed += len(jobs)
+
+            if claimed:
+                continue
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.poll_interval):
+                    await self._wakeup.wait()
+
+    async def _heartbeat(self) -> None:
+        """실행 중인 작업의 점유 기한(locked_until)을 lease의 1/3 주기로 연장합니다."""
+        while True:
+            await asyncio.sleep(self.lease.total_seconds() / 3)
+            tokens = set(self._leases.values())
+            if tokens:
+                await asyncio.to_thread(self._extend_leases, tokens)
+
+    def _extend_leases(self, tokens: set[str]) -> None:
+        with self._lock:
+            self.db.update(
+                Job,
+                and_(Job.locked_by.in_(tokens), Job.status == "running"),
+                {"locked_until": _utcnow() + self.lease},
+            )
+
+    def _claim(self, queue: str, limit: int) -> list[tuple]:
+        """
+        실행 가능한 작업을 최대 limit개 점유하는 함수.
+        후보 선택과 점유가 UPDATE ... WHERE id IN (SELECT ...) 한 문장으로 이루어지므로 워커 간에도 원자적입니다.
+        """
+        now = _utcnow()
+        token = uuid.uuid4().hex
+        runnable = and_(
+            Job.queue == queue,
+            or_(
+                and_(Job.status == "queued", Job.run_at <= now),
+                and_(Job.status == "running", Job.locked_until < now),
+            ),
+        )
+        candidates = select(Job.id).where(runnable).order_by(Job.run_at).limit(limit).scalar_subquery()
+
+        with self._lock:
+            count = self.db.update(
+                Job,
+                Job.id.in_(candidates),
+                {
+                    "status": "running",
+                    "locked_by": token,
+                    "locked_until": now + self.lease,
+                    "attempts": Job.attempts + 1,
+                },
+            )
+            if not count:
+                return []
+            jobs = self.db.select(Job, Job.locked_by == token)
+            return [(job.id, token, job.queue, job.name, job.payload, job.attempts, job.max_attempts) for job in jobs]
+
+    async def _run(
+        self, job_id: str, token: str, queue: str, name: str, payload: dict, attempts: int, max_attempts: int
+    ) -> None:
+        task = self.tasks.get(name)
+        try:
+            if task is None:
+                raise LookupError(f"Unknown task: {name}")
+            if inspect.iscoroutinefunction(task.func):
+                result = await task.func(**payload)
+            else:
+                result = await self._loop.run_in_executor(self._pool, functools.partial(task.func, **payload))
+        except asyncio.CancelledError:
+            # 종료로 중단된 작업은 시도 횟수를 되돌리고 다시 대기열에 넣습니다.
+            await asyncio.to_thread(self._finish, job_id, token, {"status": "queued", "attempts": attempts - 1})
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if task is not None and attempts < max_attempts:
+                delay = self.retry_backoff * 2 ** (attempts - 1)
+                logger.warning(
+                    f"Job {name}({job_id}) failed, retry in {delay:.1f}s [{attempts}/{max_attempts}]: {error}"
+                )
+                run_at = _utcnow() + datetime.timedelta(seconds=delay)
+                await asyncio.to_thread(
+                    self._finish, job_id, token, {"status": "queued", "error": error, "run_at": run_at}
+                )
+            else:
+                logger.error(f"Job {name}({job_id}) failed [{attempts}/{max_attempts}]: {error}")
+                await asyncio.to_thread(self._finish, job_id, token, {"status": "failed", "error": error})
+        else:
+            data = {"status": "succeeded", "result": jsonable_encoder(result), "error": None}
+            await asyncio.to_thread(self._finish, job_id, token, data)
+        finally:
+            self._leases.pop(job_id, None)
+            self._active[queue] -= 1
+            self._wakeup.set()
+
+    def _finish(self, job_id: str, token: str, data: dict[str, Any]) -> None:
+        # 점유 기한이 지나 다른 워커가 가져간 작업(locked_by 변경)은 갱신하지 않습니다.
+        with self._lock:
+            count = self.db.update(
+                Job, and_(Job.id == job_id, Job.locked_by == token), {**data, "locked_by": None, "locked_until": None}
+            )
+        if not count:
+            logger.warning(f"Job {job_id} was reclaimed by another worker, result discarded")
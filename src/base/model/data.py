@@ -0,0 +1,11 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class Message(BaseModel):
+    """실시간 채널(WebSocket)로 주고받는 메시지."""
+
+    event: str = "on_message"
+    topic: str = "default"
+    data: dict[str, Any] = Field(default_factory=dict)
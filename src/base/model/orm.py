@@ -0,0 +1,58 @@
+import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class UploadSession(Base):
+    """
+    재개 가능한 업로드의 상태 테이블.
+    offset은 디스크에 기록이 확정된 바이트 수이며, 클라이언트는 이 위치부터 이어서 전송합니다.
+    """
+
+    __tablename__ = "upload_session"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    client_id: Mapped[str] = mapped_column(String(255), index=True)
+    filename: Mapped[str] = mapped_column(String(255))
+    size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    offset: Mapped[int] = mapped_column(Integer, default=0)
+    status: Mapped[str] = mapped_column(String(16), default="pending")  # pending | completed
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
+
+
+class Job(Base):
+    """
+    백그라운드 작업 큐 테이블.
+    워커는 (queue, status, run_at) 순으로 실행할 작업을 가져오며(claim), locked_by/locked_until로 작업을 점유합니다.
+    점유 기한(locked_until)이 지난 running 작업은 워커가 비정상 종료된 것으로 보고 다른 워커가 다시 가져갑니다.
+    """
+
+    __tablename__ = "job"
+    __table_args__ = (Index("ix_job_claim", "queue", "status", "run_at"),)
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    queue: Mapped[str] = mapped_column(String(64))
+    name: Mapped[str] = mapped_column(String(255))
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    client_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    status: Mapped[str] = mapped_column(String(16), default="queued")  # queued | running | succeeded | failed
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=3)
+    result: Mapped[Any | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    run_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    locked_by: Mapped[str | None] = mapped_column(String(32), nullable=True, index=True)
+    locked_until: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
@@ -1,4 +1,6 @@
 import base64
+import contextlib
+import functools
 import hashlib
 import importlib.util
 import json
@@ -8,15 +10,23 @@ import re
 import socket
 import sys
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 import requests
 
+from base.utils.process import get_listen_ports, is_procfs_available
+
 CONTENT_TYPE_JSON = "application/json"
 
 
-def post_http_api(url: str, uri: str, headers: dict[str, str] | None = None, body: dict[str, Any] | None = None) -> Any:
+def post_http_api(
+    url: str,
+    uri: str,
+    headers: dict[str, str] | None = None,
+    body: dict[str, Any] | None = None,
+    timeout: float | None = None,
+) -> Any:
     """
     HTTP POST 요청을 보내는 함수.
 
@@ -24,10 +34,11 @@ def post_http_api(url: str, uri: str, headers: dict[str, str] | None = None, bod
     :param uri: 리소스 URI
     :param headers: 헤더
     :param body: 데이터
+    :param timeout: 연결/응답 대기 시간(초), None이면 제한 없음
     :return: 요청 결과
     """
     headers = headers or {"Content-type": CONTENT_TYPE_JSON}
-    response = requests.post(f"http://{url}{uri}", json=body, headers=headers)
+    response = requests.post(f"http://{url}{uri}", json=body, headers=headers, timeout=timeout)
     return _handle_response(response)
 
 
@@ -70,6 +81,40 @@ def _handle_response(response: requests.Response) -> Any:
         return response.content.decode("utf-8")
 
 
+def select_encoding(accept_encoding: str, available: Iterable[str]) -> str | None:
+    """
+    Accept-Encoding 헤더를 해석하여 사용할 콘텐츠 인코딩을 선택하는 함수.
+    q값이 같으면 available에 먼저 나열된(서버가 선호하는) 인코딩을 선택합니다.
+
+    :param accept_encoding: Accept-Encoding 헤더 값
+    :param available: 서버가 제공 가능한 인코딩 (선호 순)
+    :return: 선택된 인코딩, 없으면 None (identity)
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+
+    return best
+
+
 def assert_api(
     right_answer: dict[str, Any],
     url: str,
@@ -103,6 +148,7 @@ def assert_answer(
 ) -> bool:
     """
     API 결과가 정답과 일치하는지 확인하는 함수.
+    같은 정답/패턴으로 반복 검증한다면 AnswerMatcher를 한 번 생성하여 재사용하는 것이 효율적입니다.
 
     :param right_answer: 정답 문장
     :param capture_list: API 결과를 캡쳐한 문장
@@ -110,56 +156,98 @@ def assert_answer(
     :param exclude_patterns: 포함하지 않아야 하는 패턴
     :return: Pass/Fail 여부
     """
-    include_patterns = include_patterns or []
-    exclude_patterns = exclude_patterns or []
+    if not isinstance(right_answer, (dict, list)):
+        return False
 
-    if isinstance(right_answer, dict):
-        return _assert_dict_answer(right_answer, capture_list, include_patterns, exclude_patterns)
-    elif isinstance(right_answer, list):
-        return _assert_list_answer(right_answer, capture_list, include_patterns, exclude_patterns)
+    return AnswerMatcher(right_answer, include_patterns, exclude_patterns).match(capture_list)
 
-    return False
 
+class AnswerMatcher:
+    """
+    정답과 포함/제외 패턴을 미리 준비해 두고 캡쳐 리스트 전체를 한 번에 검증하는 객체.
 
-def _assert_dict_answer(
-    right_answer: dict[str, Any], capture_list: list[str], include_patterns: list[str], exclude_patterns: list[str]
-) -> bool:
-    """딕셔너리 정답을 검증하는 내부 함수."""
-    for idx, key in enumerate(right_answer.keys()):
-        if right_answer[key] not in capture_list[idx]:
-            return False
+    - 포함 패턴은 하나의 lookahead 결합식(모든 패턴 만족), 제외 패턴은 하나의 alternation(하나라도 만족)으로 컴파일합니다.
+      결합할 수 없는 패턴(역참조, 중복 그룹명, 중간 인라인 플래그 등)은 개별 컴파일로 대체합니다.
+    - 리스트 정답은 set으로 변환하여 캡쳐마다 O(1)로 확인합니다.
 
-        if not _check_patterns(capture_list[idx], include_patterns, exclude_patterns):
-            return False
+    matcher = AnswerMatcher(["OK", "DONE"], include_patterns=[r"^[A-Z]+$"])
+    matcher.match(capture_list)
+    """
 
-    return True
+    def __init__(
+        self,
+        right_answer: dict[str, Any] | list[str] | None = None,
+        include_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+    ):
+        self.right_answer = right_answer
+        self._include_checks, self._exclude_checks = _compile_patterns(
+            tuple(include_patterns or ()), tuple(exclude_patterns or ())
+        )
+
+        self._answer_set: frozenset | list | None = None
+        if isinstance(right_answer, list):
+            try:
+                self._answer_set = frozenset(right_answer)
+            except TypeError:  # 해시할 수 없는 정답은 리스트 그대로 비교
+                self._answer_set = right_answer
+
+    def check(self, text: str) -> bool:
+        """포함 패턴을 모두 만족하고 제외 패턴을 하나도 만족하지 않는지 확인합니다."""
+        for check in self._include_checks:
+            if not check(text):
+                return False
+
+        for check in self._exclude_checks:
+            if check(text):
+                return False
 
+        return True
 
-def _assert_list_answer(
-    right_answer: list[str], capture_list: list[str], include_patterns: list[str], exclude_patterns: list[str]
-) -> bool:
-    """리스트 정답을 검증하는 내부 함수."""
-    for capture in capture_list:
-        if capture not in right_answer:
-            return False
+    def match(self, capture_list: list[str]) -> bool:
+        """캡쳐 리스트 전체가 정답 및 패턴 조건을 만족하는지 확인합니다."""
+        if isinstance(self.right_answer, dict):
+            for idx, value in enumerate(self.right_answer.values()):
+                if value not in capture_list[idx] or not self.check(capture_list[idx]):
+                    return False
+            return True
 
-        if not _check_patterns(capture, include_patterns, exclude_patterns):
-            return False
+        if self._answer_set is not None:
+            answer_set = self._answer_set
+            if not all(capture in answer_set for capture in capture_list):
+                return False
 
-    return True
+        check = self.check
+        return all(check(capture) for capture in capture_list)
 
 
-def _check_patterns(text: str, include_patterns: list[str], exclude_patterns: list[str]) -> bool:
-    """포함 및 제외 패턴을 확인하는 내부 함수."""
-    for pattern in include_patterns:
-        if not re.search(pattern, text):
-            return False
+# 그룹 번호/이름을 참조하는 패턴(역참조, 조건부 그룹 (?(1)...))은 합치면 다른 패턴의 그룹을 가리키게 됩니다.
+_UNCOMBINABLE_PATTERN = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(
+    include_patterns: tuple[str, ...], exclude_patterns: tuple[str, ...]
+) -> tuple[list[Callable[[str], Any]], list[Callable[[str], Any]]]:
+    """포함/제외 패턴을 검사 함수 리스트로 컴파일하는 내부 함수. (패턴 조합 단위로 캐시)"""
+    include_checks: list[Callable[[str], Any]] = [re.compile(p).search for p in include_patterns]
+    exclude_checks: list[Callable[[str], Any]] = [re.compile(p).search for p in exclude_patterns]
 
-    for pattern in exclude_patterns:
-        if re.search(pattern, text):
-            return False
+    combinable = not any(_UNCOMBINABLE_PATTERN.search(p) for p in include_patterns + exclude_patterns)
+    if combinable and len(include_patterns) > 1:
+        # \A에 고정된 lookahead들은 각각 문자열 전체를 탐색하므로, 모두 성공해야 match됩니다.
+        with contextlib.suppress(re.error):
+            include_checks = [re.compile(r"\A" + "".join(rf"(?=[\s\S]*?(?:{p}))" for p in include_patterns)).match]
+    if combinable and len(exclude_patterns) > 1:
+        with contextlib.suppress(re.error):
+            exclude_checks = [re.compile("|".join(f"(?:{p})" for p in exclude_patterns)).search]
 
-    return True
+    return include_checks, exclude_checks
+
+
+def _check_patterns(text: str, include_patterns: list[str], exclude_patterns: list[str]) -> bool:
+    """포함 및 제외 패턴을 확인하는 내부 함수."""
+    return AnswerMatcher(include_patterns=include_patterns, exclude_patterns=exclude_patterns).check(text)
 
 
 def load_module(module_name: str, file_path: str) -> Any:
@@ -181,6 +269,21 @@ def load_module(module_name: str, file_path: str) -> Any:
     return module
 
 
+def iter_file_chunks(f_path: str, chunk_sz: int, offset: int = 0) -> Iterator[bytes]:
+    """
+    파일 내용을 chunk 단위로 순차 반환하는 함수. (전체 파일을 메모리에 올리지 않음)
+
+    :param f_path: 파일 경로
+    :param chunk_sz: 청크 크기
+    :param offset: 읽기 시작 위치
+    :return: 청크 이터레이터
+    """
+    with open(f_path, "rb") as f:
+        f.seek(offset)
+        while chunk := f.read(chunk_sz):
+            yield chunk
+
+
 def read_file_to_chunks(f_path: str, chunk_sz: int) -> list[bytes]:
     """
     파일 내용을 읽어 chunks로 분할하는 함수.
@@ -189,14 +292,7 @@ def read_file_to_chunks(f_path: str, chunk_sz: int) -> list[bytes]:
     :param chunk_sz: 청크 크기
     :return: 청크 리스트
     """
-    with open(f_path, "rb") as f:
-        chunks = []
-        while True:
-            chunk = f.read(chunk_sz)
-            if not chunk:
-                break
-            chunks.append(chunk)
-    return chunks
+    return list(iter_file_chunks(f_path, chunk_sz))
 
 
 def save_chunks_to_file(chunks: list[bytes], f_path: str) -> int:
@@ -217,6 +313,27 @@ def save_chunks_to_file(chunks: list[bytes], f_path: str) -> int:
     return result
 
 
+def append_chunks_to_file(chunks: Iterable[bytes], f_path: str, offset: int = 0) -> int:
+    """
+    청크를 파일의 offset 위치부터 이어서 기록하는 함수. (재개 가능한 업로드용)
+    offset 이후에 남아있는 불완전한 데이터는 잘라낸 뒤 기록합니다.
+
+    :param chunks: 청크 이터러블
+    :param f_path: 파일 경로
+    :param offset: 기록 시작 위치
+    :return: 작성된 바이트 수
+    """
+    result = 0  # write size
+
+    with open(f_path, "r+b" if os.path.exists(f_path) else "wb") as f:
+        f.seek(offset)
+        f.truncate()
+        for chunk in chunks:
+            result += f.write(chunk)
+
+    return result
+
+
 def convert_datetime_to_timestamp(timedelta, short: bool = False) -> str:
     """시간을 타임스탬프로 변환하는 함수."""
     return timedelta.strftime("%Y%m%d%H%M%S.%f")[:-3] if short else timedelta.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
@@ -259,22 +376,22 @@ def get_pid() -> int:
 
 
 def get_proc_listen_port(pid: int) -> list[int]:
-    """주어진 PID의 리슨 포트를 반환하는 함수."""
-    os_name = platform.platform()
-    ports: set[int] = set()
-    pattern = re.compile(r":\d+")
+    """
+    주어진 PID의 리슨 포트를 반환하는 함수.
+    Linux는 /proc을 직접 파싱하고(외부 명령 미실행, 짧은 TTL 캐시), macOS는 lsof 결과의 PID 컬럼으로 판별합니다.
+    """
+    if is_procfs_available():
+        return get_listen_ports(pid)
 
-    if "macOS" in os_name:
-        read_lines = os.popen("lsof -i -P | grep -i LISTEN").readlines()
-    elif "Linux" in os_name:
-        read_lines = os.popen("ss -tuln | grep -i LISTEN").readlines()
-    else:
+    if "macOS" not in platform.platform():
         return []
 
-    for line in read_lines:
-        if str(pid) in line:
-            match = pattern.findall(line)
-            ports.update(int(p[1:]) for p in match)
+    ports: set[int] = set()
+    pattern = re.compile(r":(\d+) \(LISTEN\)")
+    for line in os.popen(f"lsof -nP -a -p {int(pid)} -iTCP -sTCP:LISTEN").readlines():
+        fields = line.split()
+        if len(fields) > 1 and fields[1] == str(pid):
+            ports.update(int(port) for port in pattern.findall(line))
 
     return sorted(ports)
 
@@ -1,6 +1,12 @@
+import asyncio
 import functools
+import inspect
 import logging
+import threading
 import time
+from collections import OrderedDict, namedtuple
+from collections.abc import Callable, Hashable
+from typing import Any
 
 logger = logging.getLogger(__file__)
 
@@ -32,3 +38,165 @@ def perf(prefix: str = ""):
         return wrapper
 
     return decorator
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "coalesced", "maxsize", "currsize"])
+
+_KWARGS_MARK = object()
+
+
+def _make_key(*args, **kwargs) -> Hashable:
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+
+
+class _TTLCache:
+    """LRU + TTL 캐시 저장소. 동기화는 호출하는 쪽(cached)에서 담당합니다."""
+
+    __slots__ = ("maxsize", "ttl", "data", "hits", "misses", "evictions", "coalesced")
+
+    def __init__(self, maxsize: int | None, ttl: float | None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = self.misses = self.evictions = self.coalesced = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self.data.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self.data.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            del self.data[key]
+            self.evictions += 1
+        self.misses += 1
+        return False, None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self.data[key] = (expires_at, value)
+        self.data.move_to_end(key)
+        while self.maxsize is not None and len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.coalesced, self.maxsize, len(self.data))
+
+    def clear(self) -> None:
+        self.data.clear()
+        self.hits = self.misses = self.evictions = self.coalesced = 0
+
+
+class _InFlight:
+    """동기 함수의 진행 중인 호출. 같은 키의 다른 스레드는 event를 기다렸다가 결과를 공유합니다."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def cached(ttl: float | None = None, maxsize: int | None = 128, key: Callable[..., Hashable] | None = None):
+    """
+    @cached(ttl=30, maxsize=1024)
+    async def get_exchange_rate(currency: str):
+        return await fetch_rate(currency)
+
+
+    await get_exchange_rate("KRW")  # miss: 실제 호출
+    await get_exchange_rate("KRW")  # hit: 30초 동안 캐시된 값 반환
+    get_exchange_rate.cache_info()  # CacheInfo(hits=1, misses=1, evictions=0, coalesced=0, maxsize=1024, currsize=1)
+
+    - 동기/비동기 함수 모두 지원하며, 같은 키로 동시에 들어온 miss는 한 번만 실행하고 결과를 공유합니다. (single-flight)
+    - 예외는 캐시하지 않고, 대기 중이던 호출에도 같은 예외를 전달합니다.
+    - functools.wraps로 시그니처를 유지하므로 FastAPI 의존성(Depends)에도 그대로 사용할 수 있습니다.
+      예) get_current_client_id에 적용하면 토큰 -> client_id 디코딩 결과를 재사용합니다. (ttl은 토큰 만료 시간보다 짧게)
+    - key로 캐시 키 함수를 지정할 수 있으며, 인자가 해시 불가능하면 캐시 없이 호출합니다.
+    """
+
+    def decorator(func):
+        cache = _TTLCache(maxsize, ttl)
+        make_key = key or _make_key
+
+        if inspect.iscoroutinefunction(func):
+            in_flight: dict[Hashable, asyncio.Task] = {}
+
+            def on_done(cache_key: Hashable, task: asyncio.Task) -> None:
+                if in_flight.get(cache_key) is task:
+                    del in_flight[cache_key]
+                if not task.cancelled() and task.exception() is None:
+                    cache.set(cache_key, task.result())
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    cache_key = make_key(*args, **kwargs)
+                    hit, value = cache.get(cache_key)
+                except TypeError:
+                    return await func(*args, **kwargs)
+                if hit:
+                    return value
+
+                # 실제 호출은 별도 태스크에서 실행하고 모든 호출자가 shield로 기다리므로,
+                # 먼저 호출한 요청이 취소(연결 끊김 등)되어도 같은 키를 기다리는 다른 호출자에게 전파되지 않습니다.
+                loop = asyncio.get_running_loop()
+                task = in_flight.get(cache_key)
+                if task is not None and task.get_loop() is loop:
+                    cache.coalesced += 1
+                else:
+                    task = in_flight[cache_key] = loop.create_task(func(*args, **kwargs))
+                    task.add_done_callback(functools.partial(on_done, cache_key))
+                return await asyncio.shield(task)
+
+            wrapper = async_wrapper
+        else:
+            lock = threading.Lock()
+            calls: dict[Hashable, _InFlight] = {}
+
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                try:
+                    cache_key = make_key(*args, **kwargs)
+                    with lock:
+                        hit, value = cache.get(cache_key)
+                        if not hit:
+                            call = calls.get(cache_key)
+                            leader = call is None
+                            if leader:
+                                call = calls[cache_key] = _InFlight()
+                            else:
+                                cache.coalesced += 1
+                except TypeError:
+                    return func(*args, **kwargs)
+                if hit:
+                    return value
+
+                if not leader:
+                    call.event.wait()
+                    if call.error is not None:
+                        raise call.error
+                    return call.result
+
+                try:
+                    call.result = func(*args, **kwargs)
+                    with lock:
+                        cache.set(cache_key, call.result)
+                    return call.result
+                except BaseException as e:
+                    call.error = e
+                    raise
+                finally:
+                    with lock:
+                        del calls[cache_key]
+                    call.event.set()
+
+            wrapper = sync_wrapper
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
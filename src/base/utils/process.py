@@ -0,0 +1,167 @@
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+PROC = Path("/proc")
+TCP_LISTEN = "0A"  # include/net/tcp_states.h: TCP_LISTEN
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# multiprocessing spawn 워커의 명령행 인자: spawn_main(tracker_fd=N, pipe_handle=M)는 워커마다 값이 다름
+SPAWN_ARGS = re.compile(rb"spawn_main\([^)]*\)")
+
+# pid -> (만료 시각, 결과)
+_listen_port_cache: dict[int, tuple[float, list[int]]] = {}
+_worker_pid_cache: dict[int, tuple[float, list[int]]] = {}
+
+
+def is_procfs_available() -> bool:
+    """/proc 파일시스템을 사용할 수 있는지 확인하는 함수. (Linux)"""
+    return PROC.joinpath("self", "stat").exists()
+
+
+def _read_listen_inodes(pid: int) -> dict[int, int]:
+    """
+    /proc/<pid>/net/tcp{,6}에서 LISTEN 상태 소켓의 inode -> 포트 매핑을 읽는 함수.
+    프로세스의 네트워크 네임스페이스 기준으로 조회합니다.
+    """
+    inodes: dict[int, int] = {}
+    for name in ("tcp", "tcp6"):
+        try:
+            with open(PROC / str(pid) / "net" / name, encoding="ascii") as f:
+                next(f, None)  # header
+                for line in f:
+                    fields = line.split()
+                    if len(fields) > 9 and fields[3] == TCP_LISTEN:
+                        inodes[int(fields[9])] = int(fields[1].rsplit(":", 1)[1], 16)
+        except (FileNotFoundError, ProcessLookupError):  # 조회 도중 종료된 프로세스
+            continue
+    return inodes
+
+
+def _read_socket_inodes(pid: int) -> set[int]:
+    """/proc/<pid>/fd의 심볼릭 링크(socket:[inode])에서 프로세스가 소유한 소켓 inode를 읽는 함수."""
+    inodes: set[int] = set()
+    try:
+        with os.scandir(PROC / str(pid) / "fd") as entries:
+            for entry in entries:
+                try:
+                    target = os.readlink(entry.path)
+                except OSError:  # 조회 도중 fd가 닫힌 경우
+                    continue
+                if target.startswith("socket:["):
+                    inodes.add(int(target[8:-1]))
+    except (FileNotFoundError, PermissionError):
+        pass
+    return inodes
+
+
+def get_listen_ports(pid: int, ttl: float = 2.0) -> list[int]:
+    """
+    /proc을 직접 읽어 주어진 PID가 LISTEN 중인 TCP 포트 목록을 반환하는 함수.
+    외부 명령(ss, lsof)을 실행하지 않으며, 결과는 ttl초 동안 캐시됩니다.
+
+    :param pid: 프로세스 ID
+    :param ttl: 캐시 유지 시간(초), 0이면 캐시하지 않음
+    :return: 정렬된 포트 리스트
+    """
+    now = time.monotonic()
+    cached = _listen_port_cache.get(pid)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    listen_inodes = _read_listen_inodes(pid)
+    ports = sorted({listen_inodes[inode] for inode in _read_socket_inodes(pid) if inode in listen_inodes})
+
+    if ttl > 0:
+        _listen_port_cache[pid] = (now + ttl, ports)
+    return ports
+
+
+def _read_stat(pid: int) -> list[str]:
+    with open(PROC / str(pid) / "stat", encoding="utf-8", errors="replace") as f:
+        data = f.read()
+    # comm(2번째 필드)에 공백/괄호가 포함될 수 있으므로 마지막 ')' 이후부터 분리합니다. (fields[0] = state)
+    return data[data.rindex(")") + 2 :].split()
+
+
+def _read_cmdline(pid: int) -> bytes:
+    try:
+        with open(PROC / str(pid) / "cmdline", "rb") as f:
+            return f.read()
+    except (FileNotFoundError, PermissionError):
+        return b""
+
+
+def _worker_cmdline(pid: int) -> bytes:
+    """워커 비교용 명령행. spawn으로 실행된 uvicorn 워커의 워커별 인자(fd, pipe 번호)를 제거합니다."""
+    return SPAWN_ARGS.sub(b"spawn_main()", _read_cmdline(pid))
+
+
+def _boot_time() -> float:
+    with open(PROC / "stat", encoding="ascii") as f:
+        for line in f:
+            if line.startswith("btime"):
+                return float(line.split()[1])
+    return 0.0
+
+
+def get_process_stats(pid: int) -> dict[str, Any]:
+    """
+    /proc/<pid>/stat에서 CPU 시간과 RSS 등 프로세스 통계를 읽는 함수.
+    cpu_percent는 프로세스 시작 이후 평균 사용률입니다.
+
+    :param pid: 프로세스 ID
+    :return: 프로세스 통계
+    """
+    fields = _read_stat(pid)
+    utime = int(fields[11]) / CLK_TCK
+    stime = int(fields[12]) / CLK_TCK
+    started_at = _boot_time() + int(fields[19]) / CLK_TCK
+    uptime = max(time.time() - started_at, 1e-9)
+
+    return {
+        "pid": pid,
+        "ppid": int(fields[1]),
+        "state": fields[0],
+        "threads": int(fields[17]),
+        "cpu_user_seconds": round(utime, 3),
+        "cpu_system_seconds": round(stime, 3),
+        "cpu_percent": round((utime + stime) / uptime * 100, 2),
+        "rss_bytes": int(fields[21]) * PAGE_SIZE,
+        "uptime_seconds": round(uptime, 3),
+    }
+
+
+def get_worker_pids(pid: int | None = None, ttl: float = 2.0) -> list[int]:
+    """
+    같은 부모 프로세스(uvicorn 매니저)에서 같은 명령행으로 실행된 워커 PID 목록을 반환하는 함수.
+    spawn 워커의 워커별 인자는 비교에서 제외하며, 같은 부모의 다른 자식(resource_tracker 등)은 포함하지 않습니다.
+    단일 프로세스로 실행 중이면 자기 자신만 반환하며, 결과는 ttl초 동안 캐시됩니다.
+    """
+    pid = pid or os.getpid()
+    now = time.monotonic()
+    cached = _worker_pid_cache.get(pid)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    ppid = int(_read_stat(pid)[1])
+    cmdline = _worker_cmdline(pid)
+
+    workers = []
+    for entry in os.scandir(PROC):
+        if not entry.name.isdigit():
+            continue
+        other = int(entry.name)
+        try:
+            if other == pid or (int(_read_stat(other)[1]) == ppid and _worker_cmdline(other) == cmdline):
+                workers.append(other)
+        except (FileNotFoundError, ProcessLookupError, ValueError):
+            continue
+
+    workers.sort()
+    if ttl > 0:
+        _worker_pid_cache[pid] = (now + ttl, workers)
+    return workers
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__file__)
+
+
+class MemoryBackend:
+    """
+    프로세스 내부(워커 단위) 토큰 버킷 저장소.
+    버킷 상태는 (남은 토큰, 마지막 갱신 시각, 가득 차는 시각)이며, 키가 max_keys를 넘으면 가득 찬 버킷부터 정리합니다.
+    가득 차는 시각은 버킷마다 자신의 rate/burst로 계산하므로, 여러 제한기가 저장소를 공유해도 정리 기준이 섞이지 않습니다.
+    """
+
+    def __init__(self, max_keys: int = 10000, sweep_interval: float = 1.0):
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def acquire(self, key: str, rate: float, burst: int, cost: float = 1.0) -> float:
+        """토큰을 소비합니다. 허용되면 0을, 거부되면 다시 시도할 때까지의 대기 시간(초)을 반환합니다."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated, _ = self._buckets.get(key, (float(burst), now, now))
+            tokens = min(float(burst), tokens + (now - updated) * rate)
+            if tokens >= cost:
+                tokens -= cost
+                wait = 0.0
+            else:
+                wait = (cost - tokens) / rate
+            self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+
+            # 정리할 버킷이 없어도 요청마다 전체를 훑지 않도록 sweep_interval에 한 번만 정리합니다.
+            if len(self._buckets) > self.max_keys and now >= self._next_sweep:
+                self._sweep(now)
+                self._next_sweep = now + self.sweep_interval
+        return wait
+
+    def _sweep(self, now: float) -> None:
+        for key, (_, _, full_at) in list(self._buckets.items()):
+            if full_at <= now:
+                del self._buckets[key]
+
+
+class SqliteBackend:
+    """
+    여러 uvicorn 워커가 공유하는 SQLite 토큰 버킷 저장소.
+    BEGIN IMMEDIATE로 쓰기 잠금을 잡은 뒤 읽기/갱신하므로 워커 간에도 원자적으로 동작합니다.
+    가득 찬 버킷은 기본값과 같으므로 sweep_interval마다 삭제하여 테이블이 키 수만큼 계속 커지지 않게 합니다.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 5.0, sweep_interval: float = 60.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_bucket "
+            "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, full_at REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(rate_limit_bucket)")}
+        if "full_at" not in columns:
+            # 이전 스키마의 버킷은 다음 정리 때 삭제됩니다. (가득 찬 상태로 다시 시작)
+            self._conn.execute("ALTER TABLE rate_limit_bucket ADD COLUMN full_at REAL NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS rate_limit_bucket_full_at ON rate_limit_bucket (full_at)")
+
+    def acquire(self, key: str, rate: float, burst: int, cost: float = 1.0) -> float:
+        """토큰을 소비합니다. 허용되면 0을, 거부되면 다시 시도할 때까지의 대기 시간(초)을 반환합니다."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = cursor.execute("SELECT tokens, updated FROM rate_limit_bucket WHERE key = ?", (key,)).fetchone()
+                tokens, updated = row if row else (float(burst), now)
+                tokens = min(float(burst), tokens + max(0.0, now - updated) * rate)
+                if tokens >= cost:
+                    tokens -= cost
+                    wait = 0.0
+                else:
+                    wait = (cost - tokens) / rate
+                cursor.execute(
+                    "INSERT INTO rate_limit_bucket (key, tokens, updated, full_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET "
+                    "tokens = excluded.tokens, updated = excluded.updated, full_at = excluded.full_at",
+                    (key, tokens, now, now + (burst - tokens) / rate),
+                )
+                if now >= self._next_sweep:
+                    cursor.execute("DELETE FROM rate_limit_bucket WHERE full_at <= ?", (now,))
+                    self._next_sweep = now + self.sweep_interval
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        return wait
+
+
+class RateLimiter:
+    """
+    토큰 버킷 기반 요청 제한기.
+    rate는 초당 충전되는 토큰 수, burst는 버킷 크기(순간적으로 허용되는 최대 요청 수)입니다.
+    """
+
+    def __init__(self, backend: MemoryBackend | SqliteBackend, rate: float, burst: int, prefix: str = ""):
+        self.backend = backend
+        self.rate = rate
+        self.burst = burst
+        self.prefix = prefix
+
+    def hit(self, key: str, cost: float = 1.0) -> float:
+        """요청 1회를 기록합니다. 허용되면 0을, 제한되면 Retry-After로 사용할 대기 시간(초)을 반환합니다."""
+        try:
+            return self.backend.acquire(f"{self.prefix}{key}", self.rate, self.burst, cost)
+        except sqlite3.Error as e:
+            # 공유 저장소 장애로 모든 요청을 막지 않도록 허용(fail-open)합니다.
+            logger.error(f"Rate limit backend failed: {e}")
+            return 0.0
+
+    async def hit_async(self, key: str, cost: float = 1.0) -> float:
+        """
+        hit의 비동기 버전. (async 의존성용)
+        메모리 저장소는 즉시 계산되므로 이벤트 루프에서 바로 실행하고,
+        SQLite 저장소는 잠금 대기(busy timeout) 동안 루프를 막지 않도록 스레드에서 실행합니다.
+        """
+        if isinstance(self.backend, SqliteBackend):
+            return await asyncio.to_thread(self.hit, key, cost)
+        return self.hit(key, cost)
+
+
+class LoadShedder:
+    """
+    동시 실행 수 기반 부하 차단기.
+    max_concurrent개의 작업이 진행 중이면 대기열에 쌓지 않고 즉시 거부하여, 비싼 작업이 시작되기 전에 503으로 응답하게 합니다.
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max_concurrent
+        self.active = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.max_concurrent and self.active >= self.max_concurrent:
+                return False
+            self.active += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.active -= 1
@@ -58,13 +58,28 @@ class SqliteManager:
 
         return total
 
-    def update(self, orm, stmt, data: dict) -> None:
+    def get(self, orm, ident) -> object | None:
+        return self.session.get(orm, ident)
+
+    def select(self, orm, stmt=None, limit: int | None = None, order_by=None) -> list[object]:
+        query = self.session.query(orm)
+        if stmt is not None:
+            query = query.filter(stmt)
+        if order_by is not None:
+            query = query.order_by(order_by)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def update(self, orm, stmt, data: dict) -> int:
         try:
-            self.session.query(orm).filter(stmt).update(data)
+            count = self.session.query(orm).filter(stmt).update(data)
             self.session.commit()
+            return count
         except Exception as e:
             logger.error(f"Update failed: {e}")
             self.session.rollback()
+            return 0
 
     def delete(self, orm, stmt) -> None:
         try:
@@ -0,0 +1,61 @@
+"""
+Filename : asgi.py
+Title : 벤치마크 공용 ASGI 호출 도구
+Desc : 네트워크/HTTP 클라이언트 오버헤드 없이 ASGI 앱을 직접 호출하여 서버 측 처리량만 측정합니다.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+async def call(
+    app: Callable, path: str, method: str = "GET", headers: dict[str, str] | None = None, body: bytes = b""
+) -> tuple[int, dict[str, str], bytes]:
+    """ASGI 앱에 단일 HTTP 요청을 보내고 (status, headers, body)를 반환합니다."""
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 9090),
+        "extensions": {},
+    }
+    sent = False
+    status = 0
+    response_headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update({k.decode(): v.decode() for k, v in message.get("headers", [])})
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
+
+
+async def measure(app: Callable, path: str, count: int, **kwargs) -> float:
+    """count회 요청을 순차 실행하고 초당 요청 수를 반환합니다."""
+    await call(app, path, **kwargs)  # warm-up
+    start = time.perf_counter()
+    for _ in range(count):
+        await call(app, path, **kwargs)
+    return count / (time.perf_counter() - start)
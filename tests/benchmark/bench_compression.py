@@ -0,0 +1,71 @@
+"""
+Filename : bench_compression.py
+Title : 응답 압축 CPU/전송량 트레이드오프 벤치마크
+Desc : JSON 응답 본문을 인코딩/레벨별로 압축하여 압축 시간(CPU)과 압축률(전송 바이트)을 비교합니다.
+       settings.yaml의 env.*.compression.levels 값을 정할 때 참고합니다.
+
+실행 : cd tests/benchmark && python bench_compression.py [-r 2000] [-n 50]
+"""
+
+import argparse
+import json
+import time
+
+from base.api.middleware.compression import ENCODERS
+
+LEVELS = {
+    "gzip": [1, 3, 6, 9],
+    "br": [1, 4, 6, 9, 11],
+    "zstd": [1, 3, 6, 9, 19],
+}
+
+
+def args_parse():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--records", type=int, default=2000, help="JSON 레코드 수")
+    parser.add_argument("-n", "--count", type=int, default=50, help="반복 횟수")
+    return parser.parse_args()
+
+
+def make_payload(records: int) -> bytes:
+    items = [
+        {
+            "id": i,
+            "name": f"item-{i}",
+            "status": "active" if i % 3 else "inactive",
+            "score": i * 0.37,
+            "tags": ["a", "b"],
+        }
+        for i in range(records)
+    ]
+    return json.dumps({"items": items, "total": records}).encode("utf-8")
+
+
+def bench(payload: bytes, encoding: str, level: int, count: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(count):
+        compress, finish = ENCODERS[encoding](level)
+        size = len(compress(payload) + finish())
+    return (time.perf_counter() - start) / count, size
+
+
+def main(records: int, count: int):
+    payload = make_payload(records)
+    print(f"payload: {len(payload):,} bytes, encoders: {', '.join(ENCODERS)}")
+    print(f"{'encoding':<8} {'level':>5} {'ms/resp':>9} {'MB/s':>8} {'bytes':>10} {'ratio':>7}")
+
+    for encoding, levels in LEVELS.items():
+        if encoding not in ENCODERS:
+            print(f"{encoding:<8} (not installed)")
+            continue
+        for level in levels:
+            elapsed, size = bench(payload, encoding, level, count)
+            mbps = len(payload) / elapsed / 1_000_000
+            print(
+                f"{encoding:<8} {level:>5} {elapsed * 1_000:>9.3f} {mbps:>8.1f} {size:>10,} {size / len(payload):>7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    args = args_parse()
+    main(args.records, args.count)
@@ -0,0 +1,52 @@
+"""
+Filename : bench_index.py
+Title : index(/) 렌더링 처리량 벤치마크
+Desc : 캐시 없는 Jinja2 렌더링(기존 방식)과 렌더링 결과 캐시를 사용하는 경우의 requests/sec를 비교합니다.
+
+실행 : cd tests/benchmark && python bench_index.py [-n 5000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from asgi import measure
+
+from base.api.main import app, template_dir
+from base.api.templating import CachedJinja2Templates
+
+
+def args_parse():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--count", type=int, default=5000)
+    return parser.parse_args()
+
+
+async def main(count: int):
+    cached = app.templates
+
+    # before: 요청마다 TemplateResponse로 렌더링 (cacheable 미지정)
+    app.templates.cacheable = set()
+    before = await measure(app, "/", count)
+
+    # after: 렌더링 결과 캐시 사용
+    app.templates.cacheable = {"index.html"}
+    after = await measure(app, "/", count)
+
+    print(f"GET / before(render per request): {before:>10,.0f} req/s")
+    print(f"GET / after(render cache)       : {after:>10,.0f} req/s ({after / before:.2f}x)")
+
+    # 워커 시작 시 템플릿 로딩 비용 (바이트코드 캐시 유무)
+    for label, cache_dir in (
+        ("without bytecode cache", None),
+        ("with bytecode cache", cached.env.bytecode_cache.directory),
+    ):
+        templates = CachedJinja2Templates(directory=template_dir, cache_dir=cache_dir)
+        start = time.perf_counter()
+        templates.precompile()
+        print(f"precompile {label:<22}: {(time.perf_counter() - start) * 1_000:.3f} ms")
+
+
+if __name__ == "__main__":
+    args = args_parse()
+    asyncio.run(main(args.count))
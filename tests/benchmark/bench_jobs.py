@@ -0,0 +1,80 @@
+"""
+Filename : bench_jobs.py
+Title : 백그라운드 작업 큐 처리량 벤치마크
+Desc : 임시 SQLite 파일에 작업을 등록(enqueue)하는 속도와, 워커 풀이 작업을 점유 → 실행 → 완료 기록하는(dequeue) 속도를 측정합니다.
+       태스크 자체는 아무 일도 하지 않으므로 큐(SQLite 점유/갱신)와 실행 풀의 오버헤드만 측정됩니다.
+
+실행 : cd tests/benchmark && python bench_jobs.py [-n 2000] [-c 16] [-e thread]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from base.core.jobs import JobQueue
+from base.utils.sqlite import SqliteManager
+
+
+def noop(i: int) -> int:
+    return i
+
+
+async def async_noop(i: int) -> int:
+    return i
+
+
+def args_parse():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--count", type=int, default=2000)
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-e", "--executor", default="thread", choices=["thread", "process"])
+    return parser.parse_args()
+
+
+def make_queue(directory: str, name: str, concurrency: int, executor: str) -> JobQueue:
+    jobs = JobQueue(
+        SqliteManager(f"sqlite:///{Path(directory) / name}.sqlite3"),
+        queues={"default": concurrency},
+        executor=executor,
+        workers=concurrency,
+        poll_interval=0.05,
+    )
+    jobs.task("noop")(noop)
+    jobs.task("async_noop")(async_noop)
+    return jobs
+
+
+async def drain(jobs: JobQueue, count: int) -> float:
+    """워커 풀을 시작하고 등록된 작업 count개가 모두 끝날 때까지 걸린 시간으로 초당 처리 수를 계산합니다."""
+    start = time.perf_counter()
+    await jobs.start()
+    while jobs.stats()["jobs"].get("default", {}).get("succeeded", 0) < count:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    await jobs.stop()
+    return count / elapsed
+
+
+async def main(count: int, concurrency: int, executor: str):
+    print(f"jobs={count:,}, concurrency={concurrency}, executor={executor}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        jobs = make_queue(directory, "single", concurrency, executor)
+        start = time.perf_counter()
+        for i in range(count):
+            jobs.enqueue("noop", {"i": i})
+        print(f"enqueue (1 commit/job)      : {count / (time.perf_counter() - start):>10,.0f} jobs/s")
+        print(f"dequeue sync ({executor:<7})     : {await drain(jobs, count):>10,.0f} jobs/s")
+
+        jobs = make_queue(directory, "batch", concurrency, executor)
+        start = time.perf_counter()
+        jobs.enqueue_many("async_noop", [{"i": i} for i in range(count)])
+        print(f"enqueue_many (batch=500)    : {count / (time.perf_counter() - start):>10,.0f} jobs/s")
+        print(f"dequeue async (event loop)  : {await drain(jobs, count):>10,.0f} jobs/s")
+
+
+if __name__ == "__main__":
+    args = args_parse()
+    asyncio.run(main(args.count, args.concurrency, args.executor))
@@ -0,0 +1,71 @@
+"""
+Filename : bench_matcher.py
+Title : 캡쳐 결과 검증 벤치마크
+Desc : 변경 전 assert_answer(패턴 문자열 re.search 반복, 리스트 in 검사)와
+       AnswerMatcher(사전 컴파일/결합 패턴, set 정답)의 검증 속도를 비교합니다.
+
+실행 : cd tests/benchmark && python bench_matcher.py [-c 200000] [-a 1000]
+"""
+
+import argparse
+import re
+import time
+
+from base.utils.common import AnswerMatcher, assert_answer
+
+INCLUDE_PATTERNS = [r"^\[(INFO|DEBUG)\]", r"seq=\d+", r"status=(ok|done)$"]
+EXCLUDE_PATTERNS = [r"Traceback", r"ERROR", r"timeout=\d{4,}"]
+
+
+def args_parse():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--captures", type=int, default=200000, help="캡쳐 문장 수")
+    parser.add_argument("-a", "--answers", type=int, default=1000, help="정답 리스트 크기")
+    return parser.parse_args()
+
+
+def legacy_assert_answer(right_answer, capture_list, include_patterns, exclude_patterns) -> bool:
+    """변경 전 assert_answer(리스트 정답) 구현 (비교용)."""
+
+    def check_patterns(text):
+        for pattern in include_patterns:
+            if not re.search(pattern, text):
+                return False
+        for pattern in exclude_patterns:
+            if re.search(pattern, text):
+                return False
+        return True
+
+    for capture in capture_list:
+        if capture not in right_answer:
+            return False
+        if not check_patterns(capture):
+            return False
+    return True
+
+
+def bench(label: str, func) -> None:
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32}: {time.perf_counter() - start:>8.3f} s  result={result}")
+
+
+def main(captures: int, answers: int):
+    right_answer = [f"[INFO] seq={i} status={'ok' if i % 2 else 'done'}" for i in range(answers)]
+    # 정답 리스트 뒤쪽 항목일수록 기존 방식의 선형 탐색 비용이 커집니다.
+    capture_list = [right_answer[answers - 1 - (i % answers)] for i in range(captures)]
+    print(f"captures={captures:,}, answers={answers:,}")
+
+    bench(
+        "legacy assert_answer",
+        lambda: legacy_assert_answer(right_answer, capture_list, INCLUDE_PATTERNS, EXCLUDE_PATTERNS),
+    )
+    bench("assert_answer", lambda: assert_answer(right_answer, capture_list, INCLUDE_PATTERNS, EXCLUDE_PATTERNS))
+
+    matcher = AnswerMatcher(right_answer, INCLUDE_PATTERNS, EXCLUDE_PATTERNS)
+    bench("AnswerMatcher.match (reused)", lambda: matcher.match(capture_list))
+
+
+if __name__ == "__main__":
+    args = args_parse()
+    main(args.captures, args.answers)
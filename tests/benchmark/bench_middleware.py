@@ -0,0 +1,73 @@
+"""
+Filename : bench_middleware.py
+Title : 미들웨어 레이어당 오버헤드 벤치마크
+Desc : 본문 2바이트를 반환하는 라우트 하나에 아무 일도 하지 않는 미들웨어를 N겹 쌓아,
+       순수 ASGI(HTTPMiddleware)와 BaseHTTPMiddleware의 요청당/레이어당 비용을 비교합니다.
+       CORS는 starlette CORSMiddleware와 base CORSMiddleware의 일반 요청/preflight 처리량을 비교합니다.
+
+실행 : cd tests/benchmark && python bench_middleware.py [-n 5000] [-l 1 4 8]
+"""
+
+import argparse
+import asyncio
+
+from asgi import measure
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from base.api.middleware import CORSMiddleware, HTTPMiddleware
+
+CORS_OPTIONS = {"allow_origins": ["*"], "allow_methods": ["*"], "allow_headers": ["*"], "allow_credentials": True}
+SIMPLE_HEADERS = {"Origin": "http://example.com"}
+PREFLIGHT_HEADERS = {
+    "Origin": "http://example.com",
+    "Access-Control-Request-Method": "POST",
+    "Access-Control-Request-Headers": "Authorization, Content-Type",
+}
+
+
+class PassThroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+
+def make_app(middleware: list[Middleware]) -> Starlette:
+    return Starlette(routes=[Route("/", ok, methods=["GET", "POST"])], middleware=middleware)
+
+
+def args_parse():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--count", type=int, default=5000)
+    parser.add_argument("-l", "--layers", type=int, nargs="+", default=[1, 4, 8])
+    return parser.parse_args()
+
+
+async def main(count: int, layers: list[int]):
+    baseline = await measure(make_app([]), "/", count)
+    print(f"{'no middleware':<34}: {baseline:>10,.0f} req/s ({1_000_000 / baseline:.1f} us/req)")
+
+    for n in layers:
+        for label, cls in (("HTTPMiddleware", HTTPMiddleware), ("BaseHTTPMiddleware", PassThroughMiddleware)):
+            rps = await measure(make_app([Middleware(cls)] * n), "/", count)
+            per_layer = (1_000_000 / rps - 1_000_000 / baseline) / n
+            print(f"{label + f' x {n}':<34}: {rps:>10,.0f} req/s ({per_layer:>6.1f} us/layer)")
+
+    print()
+    for label, cls in (("starlette CORSMiddleware", StarletteCORSMiddleware), ("base CORSMiddleware", CORSMiddleware)):
+        app = make_app([Middleware(cls, **CORS_OPTIONS)])
+        simple = await measure(app, "/", count, headers=SIMPLE_HEADERS)
+        preflight = await measure(app, "/", count, method="OPTIONS", headers=PREFLIGHT_HEADERS)
+        print(f"{label:<34}: simple {simple:>10,.0f} req/s, preflight {preflight:>10,.0f} req/s")
+
+
+if __name__ == "__main__":
+    args = args_parse()
+    asyncio.run(main(args.count, args.layers))
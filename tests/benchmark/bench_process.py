@@ -0,0 +1,70 @@
+"""
+Filename : bench_process.py
+Title : 리슨 포트 조회 비용 벤치마크
+Desc : 기존 방식(os.popen으로 ss/lsof 실행 후 문자열 매칭)과 /proc 직접 파싱 방식의 호출당 비용을 비교합니다.
+
+실행 : cd tests/benchmark && python bench_process.py [-n 200]
+"""
+
+import argparse
+import os
+import platform
+import re
+import socket
+import time
+
+from base.utils.process import get_listen_ports, get_process_stats, get_worker_pids
+
+
+def args_parse():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--count", type=int, default=200)
+    return parser.parse_args()
+
+
+def legacy_get_proc_listen_port(pid: int) -> list[int]:
+    """변경 전 get_proc_listen_port 구현 (비교용)."""
+    os_name = platform.platform()
+    ports: set[int] = set()
+    pattern = re.compile(r":\d+")
+
+    if "macOS" in os_name:
+        read_lines = os.popen("lsof -i -P | grep -i LISTEN").readlines()
+    elif "Linux" in os_name:
+        read_lines = os.popen("ss -tuln | grep -i LISTEN").readlines()
+    else:
+        return []
+
+    for line in read_lines:
+        if str(pid) in line:
+            match = pattern.findall(line)
+            ports.update(int(p[1:]) for p in match)
+
+    return sorted(ports)
+
+
+def bench(label: str, func, count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        result = func()
+    elapsed = (time.perf_counter() - start) / count
+    print(f"{label:<34}: {elapsed * 1_000_000:>10.1f} us/call  result={result}")
+
+
+def main(count: int):
+    server = socket.create_server(("127.0.0.1", 0))
+    pid = os.getpid()
+    print(f"pid={pid}, listening on {server.getsockname()[1]}")
+
+    bench("legacy (popen ss | grep)", lambda: legacy_get_proc_listen_port(pid), max(count // 10, 1))
+    bench("/proc (no cache)", lambda: get_listen_ports(pid, ttl=0), count)
+    bench("/proc (ttl cache)", lambda: get_listen_ports(pid), count)
+    bench("process stats", lambda: get_process_stats(pid)["rss_bytes"], count)
+    bench("worker pids (no cache)", lambda: len(get_worker_pids(pid, ttl=0)), max(count // 10, 1))
+
+    server.close()
+
+
+if __name__ == "__main__":
+    args = args_parse()
+    main(args.count)
@@ -0,0 +1,85 @@
+"""
+Filename : bench_websocket.py
+Title : WebSocket 브로드캐스트 허브 팬아웃 벤치마크
+Desc : 10k개의 로컬 구독자(인메모리 WebSocket)를 한 토픽에 연결한 뒤 메시지를 발행하여
+       초당 발행 메시지 수, 초당 전달 수, 발행 → 전송 지연(p50/p99)을 측정합니다.
+       네트워크 I/O를 제외한 허브 자체(직렬화 1회 + 대기열 팬아웃 + 연결별 송신 태스크)의 비용입니다.
+       실제 소켓의 프레이밍/커널 송신/클라이언트 수신은 포함하지 않으므로, 서버 전체 처리량의 상한으로만 해석해야 합니다.
+
+실행 : cd tests/benchmark && python bench_websocket.py [-c 10000] [-m 200] [-q 256]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from base.core.hub import Hub
+from base.model.data import Message
+
+
+class LocalWebSocket:
+    """send_text 호출 시각을 (메시지 순번, 시각)으로 기록하는 인메모리 WebSocket."""
+
+    __slots__ = ("delivered",)
+
+    def __init__(self, delivered: list[tuple[int, float]]):
+        self.delivered = delivered
+
+    async def send_text(self, data: str) -> None:
+        # payload는 {..., "data": {..., "seq": N}} 형태로 끝나므로 순번만 잘라서 읽습니다.
+        self.delivered.append((int(data[data.rindex(":") + 1 : -2]), time.perf_counter()))
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+def args_parse():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--connections", type=int, default=10000)
+    parser.add_argument("-m", "--messages", type=int, default=200)
+    parser.add_argument("-q", "--queue-size", type=int, default=256)
+    return parser.parse_args()
+
+
+async def main(connections: int, messages: int, queue_size: int):
+    hub = Hub(queue_size=queue_size, drop_policy="drop_oldest")
+    sent_at: list[float] = []
+    delivered: list[tuple[int, float]] = []
+
+    subscribers = [hub.connect(LocalWebSocket(delivered), f"client-{i}") for i in range(connections)]
+    for subscriber in subscribers:
+        hub.subscribe(subscriber, "bench")
+    await asyncio.sleep(0)  # 송신 태스크 시작
+
+    publish_elapsed = 0.0
+    start = time.perf_counter()
+    for i in range(messages):
+        message = Message(topic="bench", data={"text": f"message-{i}", "seq": i})
+        sent_at.append(time.perf_counter())
+        hub.publish(message)
+        publish_elapsed += time.perf_counter() - sent_at[-1]
+        await asyncio.sleep(0)  # 송신 태스크에 실행 기회를 줌
+
+    while hub.stats()["queued"]:
+        await asyncio.sleep(0)
+    total_elapsed = time.perf_counter() - start
+
+    latencies = sorted((t - sent_at[seq]) * 1_000 for seq, t in delivered)
+
+    print("[hub only] in-memory sockets, excludes network I/O and WebSocket framing")
+    print(f"connections={connections:,}, messages={messages:,}, queue_size={queue_size}")
+    print(f"publish (fan-out enqueue) : {messages / publish_elapsed:>12,.0f} msg/s")
+    print(f"deliveries                : {len(delivered) / total_elapsed:>12,.0f} sends/s ({len(delivered):,} total)")
+    print(
+        f"latency p50 / p99         : {statistics.median(latencies):.2f} / {latencies[int(len(latencies) * 0.99)]:.2f} ms"
+    )
+    print(f"dropped                   : {hub.stats()['dropped']:,}")
+
+    for subscriber in subscribers:
+        await hub.disconnect(subscriber)
+
+
+if __name__ == "__main__":
+    args = args_parse()
+    asyncio.run(main(args.connections, args.messages, args.queue_size))
@@ -0,0 +1,65 @@
+"""
+Filename : conftest.py
+Title : pytest 공용 fixture
+Desc : 인프로세스(ASGI) 호출용 클라이언트와 인증 헤더를 제공합니다.
+       DB/업로드/캐시 경로는 임시 디렉터리로 바꾸고 요청 제한은 끄므로, 테스트가 저장소 파일이나 서로의 제한 상태에 영향을 주지 않습니다.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+from base.config import settings
+
+# 앱 모듈은 import 시점에 DB/캐시를 열기 때문에, 앱을 import하기 전에 경로를 임시 디렉터리로 바꿉니다.
+TEST_ROOT = Path(tempfile.mkdtemp(prefix="base-pytest-"))
+settings.app.database = f"sqlite:///{TEST_ROOT / 'db.sqlite3'}"
+settings.app.file.dir = TEST_ROOT / "uploads"
+settings.app.template.cache_dir = TEST_ROOT / "jinja2"
+settings.app.static.build_dir = TEST_ROOT / "static"
+settings.app.rate_limit.database = TEST_ROOT / "ratelimit.sqlite3"
+
+import base.api.router.file as file_router  # noqa: E402
+from base.api.main import app  # noqa: E402
+from base.utils.sqlite import SqliteManager  # noqa: E402
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_ROOT, ignore_errors=True)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def isolated_app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """테스트마다 업로드 디렉터리와 업로드 DB를 tmp_path로 분리하고 요청 제한을 끕니다."""
+    upload_db = SqliteManager(f"sqlite:///{tmp_path / 'db.sqlite3'}")
+    upload_db.create_table(file_router.UploadSession)
+    monkeypatch.setattr(file_router, "upload_db", upload_db)
+    monkeypatch.setattr(settings.app.file, "dir", tmp_path)
+    monkeypatch.setattr(settings.app.rate_limit, "enabled", False)
+    yield
+    upload_db.session.close()
+    upload_db.engine.dispose()
+
+
+@pytest.fixture
+async def client():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def auth_headers(client: httpx.AsyncClient) -> dict[str, str]:
+    response = await client.post(
+        "/auth/token",
+        data={"username": settings.app.auth.root_user, "password": settings.app.auth.root_password},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,59 @@
+"""
+Filename : test_auth.py
+Title : 토큰 발급 제한 테스트
+Desc : /auth/token이 요청 제한(429)과 부하 차단(503)을 Retry-After와 함께 반환하는지,
+       스레드풀이 모두 사용 중이어도 부하 차단이 대기하지 않고 바로 응답하는지 확인합니다.
+"""
+
+import asyncio
+import threading
+
+import anyio.to_thread
+import httpx
+import pytest
+
+import base.api.router.auth as auth
+from base.config import settings
+from base.utils.ratelimit import LoadShedder, MemoryBackend, RateLimiter
+
+pytestmark = pytest.mark.anyio
+
+CREDENTIALS = {"username": settings.app.auth.root_user, "password": settings.app.auth.root_password}
+
+
+@pytest.fixture
+def rate_limited(monkeypatch):
+    monkeypatch.setattr(settings.app.rate_limit, "enabled", True)
+    monkeypatch.setattr(auth, "token_ip_limiter", RateLimiter(MemoryBackend(), rate=100.0, burst=100))
+    monkeypatch.setattr(auth, "token_client_limiter", RateLimiter(MemoryBackend(), rate=0.01, burst=1))
+    monkeypatch.setattr(auth, "token_shedder", LoadShedder(1))
+
+
+async def test_token_rate_limited(client: httpx.AsyncClient, rate_limited):
+    assert (await client.post("/auth/token", data=CREDENTIALS)).status_code == 200
+
+    response = await client.post("/auth/token", data=CREDENTIALS)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+
+
+async def test_token_load_shed_without_threadpool(client: httpx.AsyncClient, rate_limited):
+    assert auth.token_shedder.try_acquire()  # 진행 중인 토큰 발급 1건
+
+    # 스레드풀을 모두 점유하여, 부하 차단 판단이 스레드풀을 기다린다면 응답하지 못하게 합니다.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    total_tokens, limiter.total_tokens = limiter.total_tokens, 1
+    release = threading.Event()
+    blocker = asyncio.create_task(anyio.to_thread.run_sync(release.wait))
+    try:
+        await asyncio.sleep(0.05)
+        async with asyncio.timeout(2):
+            response = await client.post("/auth/token", data=CREDENTIALS)
+    finally:
+        release.set()
+        await blocker
+        limiter.total_tokens = total_tokens
+        auth.token_shedder.release()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.app.rate_limit.retry_after)
@@ -0,0 +1,28 @@
+"""
+Filename : test_common.py
+Title : 패턴 검사 테스트
+Desc : 여러 패턴을 하나의 정규식으로 합쳐도 개별 검사와 결과가 같은지 확인합니다.
+"""
+
+import re
+
+import pytest
+
+from base.utils.common import _check_patterns
+
+
+@pytest.mark.parametrize(
+    "text, include_patterns, exclude_patterns",
+    [
+        ("x c", [r"(x)", r"(a)?(?(1)b|c)"], []),
+        ("x c", [r"(x)", r"(?P<a>a)?(?(a)b|c)"], []),
+        ("aa b", [r"(a)\1", r"(b)"], []),
+        ("x c", [r"x"], [r"(y)", r"(a)?(?(1)b|c)"]),
+        ("abc", [r"a", r"c"], [r"d", r"e"]),
+    ],
+)
+def test_combined_patterns_match_individual_checks(text, include_patterns, exclude_patterns):
+    expected = all(re.search(p, text) for p in include_patterns) and not any(
+        re.search(p, text) for p in exclude_patterns
+    )
+    assert _check_patterns(text, include_patterns, exclude_patterns) == expected
@@ -0,0 +1,51 @@
+"""
+Filename : test_compression.py
+Title : 압축 미들웨어 테스트
+Desc : 일반 응답은 압축하고, Range를 지원하는 파일 다운로드는 원본 그대로 전달하는지 확인합니다.
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from base.api.middleware.compression import CompressionMiddleware
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def compressed_client(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("a" * 10_000)
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, levels={"gzip": 6})
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse("a" * 10_000)
+
+    @app.get("/download")
+    async def download():
+        return FileResponse(path, filename="data.txt")
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_text_is_compressed(compressed_client):
+    async with compressed_client as client:
+        response = await client.get("/text", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+
+
+async def test_download_is_not_compressed(compressed_client):
+    async with compressed_client as client:
+        response = await client.get("/download", headers={"accept-encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == "10000"
+
+        response = await client.get("/download", headers={"accept-encoding": "gzip", "range": "bytes=100-199"})
+        assert response.status_code == 206
+        assert "content-encoding" not in response.headers
+        assert response.content == b"a" * 100
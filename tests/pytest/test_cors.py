@@ -0,0 +1,117 @@
+"""
+Filename : test_cors.py
+Title : CORS 미들웨어 / 미들웨어 스택 테스트
+Desc : preflight 허용/거부, Access-Control-Max-Age, credentials 사용 시 Origin 반사와 Vary,
+       Origin 없는 요청 통과, 앱이 지정한 Vary와의 병합, add_middlewares의 이름 검사와 등록 순서를 확인합니다.
+"""
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from base.api.middleware import CompressionMiddleware, CORSMiddleware, add_middlewares
+
+pytestmark = pytest.mark.anyio
+
+ORIGIN = "https://app.example.com"
+
+
+async def index(request):
+    return PlainTextResponse("ok", headers={"Vary": "Accept-Language"} if "vary" in request.query_params else None)
+
+
+def make_client(**options) -> httpx.AsyncClient:
+    app = Starlette(routes=[Route("/", index, methods=["GET", "POST"])])
+    app.add_middleware(CORSMiddleware, **options)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def preflight_headers(origin: str = ORIGIN, method: str = "POST", headers: str | None = None) -> dict[str, str]:
+    request_headers = {"Origin": origin, "Access-Control-Request-Method": method}
+    if headers is not None:
+        request_headers["Access-Control-Request-Headers"] = headers
+    return request_headers
+
+
+async def test_preflight_allowed():
+    options = {"allow_origins": [ORIGIN], "allow_methods": ["GET", "POST"], "allow_headers": ["X-Token"]}
+    async with make_client(**options, max_age=1234) as client:
+        response = await client.options("/", headers=preflight_headers(headers="X-Token, Content-Type"))
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-methods"] == "GET, POST"
+    assert response.headers["access-control-max-age"] == "1234"
+    assert "x-token" in response.headers["access-control-allow-headers"]
+
+
+@pytest.mark.parametrize(
+    "headers, reason",
+    [
+        (preflight_headers(origin="https://evil.example.com"), "origin"),
+        (preflight_headers(method="DELETE"), "method"),
+        (preflight_headers(headers="X-Other"), "headers"),
+    ],
+)
+async def test_preflight_rejected(headers: dict[str, str], reason: str):
+    options = {"allow_origins": [ORIGIN], "allow_methods": ["GET", "POST"], "allow_headers": ["X-Token"]}
+    async with make_client(**options) as client:
+        response = await client.options("/", headers=headers)
+
+    assert response.status_code == 400
+    assert response.text == f"Disallowed CORS {reason}"
+    if reason == "origin":
+        assert "access-control-allow-origin" not in response.headers
+
+
+async def test_credentialed_request_echoes_origin():
+    async with make_client(allow_origins=["*"], allow_credentials=True, expose_headers=["X-Total"]) as client:
+        response = await client.get("/", headers={"Origin": ORIGIN})
+
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-expose-headers"] == "X-Total"
+    assert response.headers["vary"] == "Origin"
+
+
+async def test_wildcard_without_credentials():
+    async with make_client(allow_origins=["*"]) as client:
+        response = await client.get("/", headers={"Origin": ORIGIN})
+
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "vary" not in response.headers
+
+
+async def test_request_without_origin_passes_through():
+    async with make_client(allow_origins=["*"], allow_credentials=True) as client:
+        response = await client.get("/")
+
+    assert response.text == "ok"
+    assert not any(name.startswith("access-control-") for name in response.headers)
+    assert "vary" not in response.headers
+
+
+async def test_vary_is_merged_with_app_header():
+    async with make_client(allow_origins=[ORIGIN]) as client:
+        response = await client.get("/", params={"vary": "1"}, headers={"Origin": ORIGIN})
+
+    assert response.headers.get_list("vary") == ["Accept-Language, Origin"]
+
+
+def test_add_middlewares_rejects_unknown_name():
+    with pytest.raises(ValueError, match="Unknown middleware"):
+        add_middlewares(Starlette(), ["cors", "gzip"], {"cors": {}})
+
+
+def test_add_middlewares_applies_order():
+    app = Starlette()
+    enabled = add_middlewares(app, ["compression", "cors"], {"compression": {}, "cors": {}})
+    assert enabled == ["compression", "cors"]
+    # user_middleware는 바깥쪽 레이어가 앞에 옵니다.
+    assert [middleware.cls for middleware in app.user_middleware] == [CompressionMiddleware, CORSMiddleware]
+
+    app = Starlette()
+    assert add_middlewares(app, ["cors", "compression"], {"cors": {}, "compression": None}) == ["cors"]
+    assert [middleware.cls for middleware in app.user_middleware] == [CORSMiddleware]
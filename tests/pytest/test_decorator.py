@@ -0,0 +1,148 @@
+"""
+Filename : test_decorator.py
+Title : cached 데코레이터 테스트
+Desc : 동시 miss 병합(single-flight), 호출 취소 격리, TTL/LRU 만료, FastAPI 의존성 사용을 확인합니다.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+
+from base.utils.decorator import cached
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_async_concurrent_misses_are_coalesced():
+    calls = 0
+
+    @cached(ttl=10)
+    async def double(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    assert await asyncio.gather(*[double(1) for _ in range(10)]) == [2] * 10
+    assert calls == 1
+    assert double.cache_info().coalesced == 9
+    assert await double(1) == 2
+    assert double.cache_info().hits == 1
+
+
+async def test_sync_concurrent_misses_are_coalesced():
+    calls = 0
+
+    @cached(ttl=10)
+    def identity(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.1)
+        return x
+
+    threads = [threading.Thread(target=identity, args=(1,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+    assert identity.cache_info().coalesced == 7
+
+
+async def test_cancelled_caller_does_not_cancel_waiters():
+    started = asyncio.Event()
+
+    @cached(ttl=10)
+    async def slow() -> str:
+        started.set()
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    leader = asyncio.create_task(slow())
+    await started.wait()
+    waiter = asyncio.create_task(slow())
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert slow.cache_info().currsize == 1
+
+
+async def test_exceptions_are_not_cached():
+    calls = 0
+
+    @cached()
+    async def fail() -> None:
+        nonlocal calls
+        calls += 1
+        raise ValueError
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await fail()
+    assert calls == 2
+    assert fail.cache_info().currsize == 0
+
+
+async def test_ttl_expiry():
+    @cached(ttl=0.05)
+    def now() -> float:
+        return time.monotonic()
+
+    first = now()
+    assert now() == first
+    time.sleep(0.06)
+    assert now() != first
+    assert now.cache_info().evictions == 1
+
+
+async def test_lru_eviction():
+    @cached(maxsize=2)
+    def identity(x: int) -> int:
+        return x
+
+    identity(1)
+    identity(2)
+    identity(1)  # 1을 최근 사용으로 갱신
+    identity(3)  # 가장 오래된 2가 제거됨
+
+    info = identity.cache_info()
+    assert (info.evictions, info.currsize) == (1, 2)
+    identity(1)
+    assert identity.cache_info().hits == 2
+    identity(2)
+    assert identity.cache_info().misses == 4
+
+
+async def test_fastapi_dependency():
+    calls = 0
+
+    @cached(ttl=10)
+    async def get_client_id(token: str) -> str:
+        nonlocal calls
+        calls += 1
+        if token == "bad":
+            raise HTTPException(status_code=401)
+        return f"client-{token}"
+
+    app = FastAPI()
+
+    @app.get("/")
+    async def index(client_id: str = Depends(get_client_id)):
+        return client_id
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        for _ in range(3):
+            response = await client.get("/", params={"token": "abc"})
+            assert response.json() == "client-abc"
+        assert (await client.get("/", params={"token": "bad"})).status_code == 401
+        assert (await client.get("/")).status_code == 422
+
+    assert calls == 2
@@ -0,0 +1,100 @@
+"""
+Filename : test_file.py
+Title : 재개 가능한 업로드 테스트
+Desc : 같은 업로드에 동시에 들어온 PATCH 요청이 서로의 데이터를 덮어쓰지 않는지 확인합니다.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from base.api.router.file import _db_lock, _part_path
+
+pytestmark = pytest.mark.anyio
+
+CHUNK = 1000
+CHUNKS = 10
+
+
+async def slow_body(fill: bytes):
+    """청크 사이에 제어권을 넘겨 두 요청의 본문 전송이 서로 섞이도록 합니다."""
+    for _ in range(CHUNKS):
+        yield fill * CHUNK
+        await asyncio.sleep(0.01)
+
+
+async def test_concurrent_patch_does_not_lose_data(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    response = await client.post("/file/uploads", json={"filename": "race.bin"}, headers=auth_headers)
+    upload_id = response.json()["upload_id"]
+
+    async def patch(fill: bytes) -> httpx.Response:
+        headers = {**auth_headers, "Upload-Offset": "0", "Content-Type": "application/offset+octet-stream"}
+        return await client.patch(f"/file/uploads/{upload_id}", content=slow_body(fill), headers=headers)
+
+    first, second = await asyncio.gather(patch(b"A"), patch(b"B"))
+
+    assert sorted([first.status_code, second.status_code]) == [200, 409]
+    winner = b"A" if first.status_code == 200 else b"B"
+
+    state = (await client.get(f"/file/uploads/{upload_id}", headers=auth_headers)).json()
+    assert state["offset"] == CHUNK * CHUNKS
+    assert _part_path(upload_id).read_bytes() == winner * (CHUNK * CHUNKS)
+
+
+async def test_patch_resumes_from_offset(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    response = await client.post("/file/uploads", json={"filename": "resume.bin", "size": 6}, headers=auth_headers)
+    upload_id = response.json()["upload_id"]
+    url = f"/file/uploads/{upload_id}"
+
+    response = await client.patch(url, content=b"abc", headers={**auth_headers, "Upload-Offset": "0"})
+    assert response.json()["offset"] == 3
+
+    response = await client.patch(url, content=b"xyz", headers={**auth_headers, "Upload-Offset": "0"})
+    assert response.status_code == 409
+
+    response = await client.patch(url, content=b"def", headers={**auth_headers, "Upload-Offset": "3"})
+    assert response.json()["status"] == "completed"
+    assert (await client.get(f"/file/{upload_id}", headers=auth_headers)).content == b"abcdef"
+
+
+async def test_deferred_length_completes_upload(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    response = await client.post("/file/uploads", json={"filename": "deferred.bin"}, headers=auth_headers)
+    upload_id = response.json()["upload_id"]
+    url = f"/file/uploads/{upload_id}"
+
+    response = await client.patch(url, content=b"abc", headers={**auth_headers, "Upload-Offset": "0"})
+    assert (response.json()["status"], response.json()["size"]) == ("pending", None)
+
+    response = await client.patch(
+        url, content=b"", headers={**auth_headers, "Upload-Offset": "3", "Upload-Length": "2"}
+    )
+    assert response.status_code == 400
+
+    headers = {**auth_headers, "Upload-Offset": "3", "Upload-Length": "6"}
+    response = await client.patch(url, content=b"def", headers=headers)
+    assert (response.json()["status"], response.json()["size"]) == ("completed", 6)
+    assert response.headers["Upload-Length"] == "6"
+    assert (await client.get(f"/file/{upload_id}", headers=auth_headers)).content == b"abcdef"
+
+
+async def test_upload_length_cannot_change(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    response = await client.post("/file/uploads", json={"filename": "fixed.bin", "size": 6}, headers=auth_headers)
+    url = f"/file/uploads/{response.json()['upload_id']}"
+
+    response = await client.patch(
+        url, content=b"abc", headers={**auth_headers, "Upload-Offset": "0", "Upload-Length": "3"}
+    )
+    assert response.status_code == 400
+
+
+async def test_database_wait_does_not_block_event_loop(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    response = await client.post("/file/uploads", json={"filename": "busy.bin"}, headers=auth_headers)
+    url = f"/file/uploads/{response.json()['upload_id']}"
+
+    with _db_lock:  # 다른 요청이 DB를 사용 중(busy timeout 대기)인 상황
+        pending = asyncio.create_task(client.get(url, headers=auth_headers))
+        await asyncio.sleep(0.05)
+        assert (await client.get("/health/live")).status_code == 200
+        assert not pending.done()
+    assert (await pending).status_code == 200
@@ -0,0 +1,48 @@
+"""
+Filename : test_health.py
+Title : readiness 테스트
+Desc : 필수 워밍업 단계 실패와 종료 신호(drain) 시 /health/ready가 503을 반환하는지 확인합니다.
+"""
+
+import asyncio
+import os
+import signal
+from types import SimpleNamespace
+
+import pytest
+
+import base.api.main as main
+from base.api.main import app, lifespan
+
+pytestmark = pytest.mark.anyio
+
+
+class BrokenEngine:
+    def connect(self):
+        raise OSError("database unavailable")
+
+
+async def test_ready_after_warm_up(client):
+    async with lifespan(app):
+        response = await client.get("/health/ready")
+    assert response.status_code == 200
+
+
+async def test_not_ready_when_database_fails(client, monkeypatch):
+    monkeypatch.setattr(main, "upload_db", SimpleNamespace(engine=BrokenEngine()))
+    async with lifespan(app):
+        response = await client.get("/health/ready")
+    assert (response.status_code, response.json()) == (503, {"status": "not ready"})
+
+
+async def test_draining_on_sigterm(client, monkeypatch):
+    forwarded = []
+    monkeypatch.setattr(main.settings.app.health, "drain_seconds", 0.01)
+    monkeypatch.setattr(signal, "getsignal", lambda sig: lambda *args: forwarded.append(sig))
+    async with lifespan(app):
+        os.kill(os.getpid(), signal.SIGTERM)
+        response = await client.get("/health/ready")
+        assert (response.status_code, response.json()) == (503, {"status": "draining"})
+        assert forwarded == []  # drain_seconds 동안 uvicorn에 전달되지 않음
+        await asyncio.sleep(0.05)
+        assert forwarded == [signal.SIGTERM]
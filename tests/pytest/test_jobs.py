@@ -0,0 +1,195 @@
+"""
+Filename : test_jobs.py
+Title : 백그라운드 작업 큐 테스트
+Desc : 재시도/백오프, 점유 기한 만료 후 재점유, heartbeat 연장, 종료 시 재대기, 큐별 동시 실행 제한,
+       POST /job/http 허용 대상 검사와 요청 시간 제한을 임시 SQLite DB로 확인합니다.
+"""
+
+import asyncio
+import datetime
+import socket
+import time
+
+import httpx
+import pytest
+import requests
+
+import base.api.router.job as job_router
+from base.config import settings
+from base.core.jobs import JobQueue
+from base.model.orm import Job
+from base.utils.sqlite import SqliteManager
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def make_queue(tmp_path):
+    queues: list[JobQueue] = []
+
+    def make(**kwargs) -> JobQueue:
+        # 같은 DB 파일을 여러 큐(워커)가 공유할 수 있도록 큐마다 별도 세션을 만듭니다.
+        db = SqliteManager(f"sqlite:///{tmp_path / 'jobs.sqlite3'}")
+        queue = JobQueue(db, **{"poll_interval": 0.05, "retry_backoff": 0.01, **kwargs})
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        await queue.stop(timeout=0)
+        queue.db.session.close()
+        queue.db.engine.dispose()
+
+
+async def wait_for_status(queue: JobQueue, job_id: str, *statuses: str, timeout: float = 5.0) -> dict:
+    async with asyncio.timeout(timeout):
+        while (job := queue.get(job_id))["status"] not in statuses:
+            await asyncio.sleep(0.01)
+    return job
+
+
+def expire_lease(queue: JobQueue, job_id: str) -> None:
+    past = datetime.datetime.now(datetime.UTC) - datetime.timedelta(seconds=1)
+    queue.db.update(Job, Job.id == job_id, {"locked_until": past})
+
+
+async def test_retry_with_backoff_then_success(make_queue):
+    jobs = make_queue()
+    calls = 0
+
+    @jobs.task("flaky", max_attempts=3)
+    def flaky(value: int) -> int:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise ValueError("boom")
+        return value * 2
+
+    job_id = jobs.enqueue("flaky", {"value": 21})
+    await jobs.start()
+    job = await wait_for_status(jobs, job_id, "succeeded")
+    assert (job["attempts"], job["result"], job["error"], job["locked_by"]) == (3, 42, None, None)
+
+
+async def test_failed_after_max_attempts(make_queue):
+    jobs = make_queue()
+
+    @jobs.task("broken", max_attempts=2)
+    async def broken() -> None:
+        raise RuntimeError("always")
+
+    job_id = jobs.enqueue("broken")
+    await jobs.start()
+    job = await wait_for_status(jobs, job_id, "failed")
+    assert (job["attempts"], job["error"]) == (2, "RuntimeError: always")
+
+
+async def test_expired_lease_is_reclaimed_and_stale_finish_is_discarded(make_queue):
+    crashed, alive = make_queue(), make_queue()
+    for queue in (crashed, alive):
+        queue.task("noop")(lambda: None)
+
+    job_id = crashed.enqueue("noop")
+    [(_, stale_token, *_)] = crashed._claim("default", 1)
+    assert alive._claim("default", 1) == []  # 점유 기한 안에서는 가져가지 않음
+
+    expire_lease(crashed, job_id)
+    [(reclaimed_id, token, _, _, _, attempts, _)] = alive._claim("default", 1)
+    assert (reclaimed_id, attempts) == (job_id, 2)
+
+    crashed._finish(job_id, stale_token, {"status": "succeeded", "result": "stale"})
+    assert alive.get(job_id)["status"] == "running"
+    alive._finish(job_id, token, {"status": "succeeded", "result": "fresh"})
+    assert alive.get(job_id)["result"] == "fresh"
+
+
+async def test_heartbeat_renews_lease_of_running_job(make_queue):
+    jobs, other = make_queue(lease_seconds=0.3), make_queue(lease_seconds=0.3)
+    calls = 0
+
+    @jobs.task("slow")
+    async def slow() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1.0)
+
+    other.task("slow")(slow)
+    job_id = jobs.enqueue("slow")
+    await jobs.start()
+    await wait_for_status(jobs, job_id, "running")
+
+    # 점유 기한(0.3초)을 여러 번 넘기는 동안 다른 워커가 가져가지 못해야 합니다.
+    for _ in range(6):
+        await asyncio.sleep(0.1)
+        assert other._claim("default", 1) == []
+    await wait_for_status(jobs, job_id, "succeeded")
+    assert calls == 1
+
+
+async def test_stop_requeues_running_job_and_restores_attempts(make_queue):
+    jobs = make_queue()
+    started = asyncio.Event()
+
+    @jobs.task("endless")
+    async def endless() -> None:
+        started.set()
+        await asyncio.sleep(60)
+
+    job_id = jobs.enqueue("endless")
+    await jobs.start()
+    await started.wait()
+    await jobs.stop(timeout=0.05)
+
+    job = jobs.get(job_id)
+    assert (job["status"], job["attempts"], job["locked_by"]) == ("queued", 0, None)
+
+
+async def test_queue_concurrency_limit(make_queue):
+    jobs = make_queue(queues={"limited": 2})
+    running = peak = 0
+
+    @jobs.task("work", queue="limited")
+    async def work() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+
+    job_ids = jobs.enqueue_many("work", [{} for _ in range(6)])
+    await jobs.start()
+    for job_id in job_ids:
+        await wait_for_status(jobs, job_id, "succeeded")
+    assert peak == 2
+
+
+async def test_http_job_target_allowlist(client: httpx.AsyncClient, auth_headers: dict[str, str], monkeypatch):
+    enqueued = []
+
+    async def enqueue_async(name, payload, client_id=None, delay=0):
+        enqueued.append(payload)
+        return "job-id"
+
+    monkeypatch.setattr(job_router.jobs, "enqueue_async", enqueue_async)
+    monkeypatch.setattr(settings.app.job, "http_allowed_hosts", ["api.example.com"])
+
+    async def post(url: str, uri: str) -> int:
+        response = await client.post("/job/http", json={"url": url, "uri": uri}, headers=auth_headers)
+        return response.status_code
+
+    assert await post("169.254.169.254", "/latest/meta-data") == 403
+    assert await post("api.example.com", "@169.254.169.254/") == 403
+    assert await post("api.example.com", "/hook") == 202
+    assert [payload["url"] for payload in enqueued] == ["api.example.com"]
+
+
+async def test_http_job_does_not_hang_on_silent_upstream(monkeypatch):
+    monkeypatch.setattr(settings.app.job, "http_timeout", 0.2)
+    with socket.create_server(("127.0.0.1", 0)) as server:  # 연결은 받지만 응답하지 않는 대상
+        host, port = server.getsockname()
+        post = job_router.jobs.tasks["http.post"].func
+
+        start = time.perf_counter()
+        with pytest.raises(requests.Timeout):
+            await asyncio.to_thread(post, f"{host}:{port}", "/hook")
+        assert time.perf_counter() - start < 2
@@ -0,0 +1,68 @@
+"""
+Filename : test_process.py
+Title : /proc 기반 프로세스 조회 테스트
+Desc : LISTEN 포트를 PID 단위로 정확히 찾는지(다른 프로세스의 포트를 섞지 않는지),
+       조회 도중 종료된 워커 때문에 /app/process가 실패하지 않는지 확인합니다.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+import base.api.router.default as default_router
+from base.utils.process import _read_listen_inodes, get_listen_ports, is_procfs_available
+
+pytestmark = pytest.mark.skipif(not is_procfs_available(), reason="/proc is not available")
+
+LISTEN_CHILD = """
+import socket, sys
+server = socket.create_server(("127.0.0.1", 0))
+print(server.getsockname()[1], flush=True)
+sys.stdin.read()
+"""
+
+
+def test_listen_ports_of_current_process():
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        port = server.getsockname()[1]
+        inode = os.fstat(server.fileno()).st_ino
+
+        assert _read_listen_inodes(os.getpid())[inode] == port
+        assert port in get_listen_ports(os.getpid(), ttl=0)
+    assert port not in get_listen_ports(os.getpid(), ttl=0)
+
+
+def test_listen_ports_are_not_mixed_between_processes():
+    child = subprocess.Popen([sys.executable, "-c", LISTEN_CHILD], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        child_port = int(child.stdout.readline())
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+            assert child_port in get_listen_ports(child.pid, ttl=0)
+            assert port not in get_listen_ports(child.pid, ttl=0)
+            assert child_port not in get_listen_ports(os.getpid(), ttl=0)
+    finally:
+        child.stdin.close()
+        child.wait(timeout=5)
+
+
+@pytest.mark.anyio
+async def test_process_endpoint_skips_exited_worker(client: httpx.AsyncClient, monkeypatch):
+    exited = 999_999_999
+    monkeypatch.setattr(default_router, "get_worker_pids", lambda pid: [pid, exited])
+    get_process_stats = default_router.get_process_stats
+
+    def process_stats(pid: int) -> dict:
+        if pid == exited:  # open 이후 read 시점에 종료된 워커 (ESRCH)
+            raise ProcessLookupError(3, "No such process")
+        return get_process_stats(pid)
+
+    monkeypatch.setattr(default_router, "get_process_stats", process_stats)
+    response = await client.get("/app/process")
+
+    assert response.status_code == 200
+    assert [worker["pid"] for worker in response.json()["workers"]] == [os.getpid()]
@@ -0,0 +1,55 @@
+"""
+Filename : test_ratelimit.py
+Title : 토큰 버킷 저장소 테스트
+Desc : 여러 제한기가 저장소를 공유해도 정리(sweep)가 다른 제한기의 버킷을 지우지 않는지, SQLite 테이블이 정리되는지 확인합니다.
+"""
+
+import sqlite3
+
+from base.utils.ratelimit import MemoryBackend, RateLimiter, SqliteBackend
+
+
+def test_memory_sweep_keeps_other_limiters_buckets():
+    backend = MemoryBackend(max_keys=1)
+    slow = RateLimiter(backend, rate=0.001, burst=1, prefix="slow:")
+    fast = RateLimiter(backend, rate=1000.0, burst=1, prefix="fast:")
+
+    assert slow.hit("a") == 0
+    assert fast.hit("b") == 0  # max_keys를 넘어 정리가 실행됨
+    assert slow.hit("a") > 0
+
+
+def test_memory_sweep_removes_full_buckets():
+    backend = MemoryBackend(max_keys=2, sweep_interval=0)
+    limiter = RateLimiter(backend, rate=1_000_000.0, burst=1)
+    for key in range(10):
+        limiter.hit(str(key))
+    assert len(backend._buckets) <= 2
+
+
+def test_sqlite_prunes_full_buckets(tmp_path):
+    backend = SqliteBackend(tmp_path / "ratelimit.sqlite3", sweep_interval=0)
+    limiter = RateLimiter(backend, rate=1_000_000.0, burst=1)
+    slow = RateLimiter(backend, rate=0.001, burst=1, prefix="slow:")
+    slow.hit("a")
+    for key in range(10):
+        limiter.hit(str(key))
+
+    with sqlite3.connect(backend.path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT key FROM rate_limit_bucket ORDER BY key")]
+    assert keys == ["9", "slow:a"]
+    assert slow.hit("a") > 0
+
+
+def test_sqlite_migrates_old_schema(tmp_path):
+    path = tmp_path / "ratelimit.sqlite3"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE rate_limit_bucket (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO rate_limit_bucket VALUES ('old', 0, 0)")
+
+    limiter = RateLimiter(SqliteBackend(path), rate=1.0, burst=1)
+    assert limiter.hit("new") == 0
+    with sqlite3.connect(path) as conn:
+        assert [row[0] for row in conn.execute("SELECT key FROM rate_limit_bucket")] == ["new"]
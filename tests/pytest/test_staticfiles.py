@@ -0,0 +1,109 @@
+"""
+Filename : test_staticfiles.py
+Title : 사전 압축 정적 파일 테스트
+Desc : 지문 경로 변환(static_url), Accept-Encoding에 따른 br/gzip/원본 선택, immutable 캐시 헤더,
+       인코딩별 ETag와 304 재검증, GET/HEAD 외 메서드 거부, 지문 없는 경로의 StaticFiles 동작을 확인합니다.
+"""
+
+import httpx
+import jinja2
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from base.api.staticfiles import PrecompressedStaticFiles, brotli
+
+pytestmark = pytest.mark.anyio
+requires_brotli = pytest.mark.skipif(brotli is None, reason="brotli is not installed (pip install base[compress])")
+
+CSS = b"body { color: #333; }\n" * 100
+
+
+@pytest.fixture
+def static_files(tmp_path) -> PrecompressedStaticFiles:
+    source = tmp_path / "static"
+    (source / "css").mkdir(parents=True)
+    (source / "css" / "main.css").write_bytes(CSS)
+    (source / "logo.png").write_bytes(b"\x89PNG" + b"\x00" * 1000)
+    return PrecompressedStaticFiles(directory=source, build_dir=tmp_path / "build", max_age=600)
+
+
+@pytest.fixture
+async def static_client(static_files):
+    app = Starlette(routes=[Mount("/static", static_files)])
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def test_static_url_resolves_fingerprinted_path(static_files):
+    env = jinja2.Environment()
+    env.globals["static_url"] = static_files.url
+    url = env.from_string("{{ static_url('css/main.css') }}").render()
+
+    assert url == f"/static/{static_files.manifest['css/main.css']}"
+    assert url.startswith("/static/css/main.") and url.endswith(".css") and url != "/static/css/main.css"
+    assert static_files.url("missing.js") == "/static/missing.js"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        pytest.param("gzip, br", "br", marks=requires_brotli),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("br;q=0.5, gzip;q=1", "gzip"),
+        ("identity", None),
+        ("gzip;q=0, br;q=0", None),
+    ],
+)
+async def test_encoding_selection(static_client, static_files, accept_encoding, expected):
+    url = static_files.url("css/main.css")
+    response = await static_client.get(url, headers={"Accept-Encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["cache-control"] == "public, max-age=600, immutable"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.content == CSS  # httpx가 Content-Encoding을 풀어서 돌려줍니다.
+
+
+@requires_brotli
+async def test_etag_per_encoding_and_not_modified(static_client, static_files):
+    url = static_files.url("css/main.css")
+    etags = {}
+    for encoding in ("br", "gzip", "identity"):
+        response = await static_client.get(url, headers={"Accept-Encoding": encoding})
+        etags[encoding] = response.headers["etag"]
+    assert len(set(etags.values())) == 3
+
+    response = await static_client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etags["gzip"]})
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == "public, max-age=600, immutable"
+
+    response = await static_client.get(url, headers={"Accept-Encoding": "br", "If-None-Match": etags["gzip"]})
+    assert response.status_code == 200
+
+
+async def test_incompressible_asset_has_no_variants(static_client, static_files):
+    response = await static_client.get(static_files.url("logo.png"), headers={"Accept-Encoding": "br, gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+async def test_non_get_method_not_allowed(static_client, static_files):
+    response = await static_client.post(static_files.url("css/main.css"))
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET, HEAD"
+
+
+async def test_unhashed_path_falls_back_to_static_files(static_client):
+    response = await static_client.get("/static/css/main.css", headers={"Accept-Encoding": "br"})
+    assert response.status_code == 200
+    assert response.content == CSS
+    assert "content-encoding" not in response.headers
+    assert "immutable" not in response.headers.get("cache-control", "")
+    assert "etag" in response.headers and "last-modified" in response.headers
+
+    response = await static_client.get("/static/css/missing.css")
+    assert response.status_code == 404
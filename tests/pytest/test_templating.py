@@ -0,0 +1,47 @@
+"""
+Filename : test_templating.py
+Title : 템플릿 렌더링 캐시 테스트
+Desc : extends/include로 참조하는 템플릿이 바뀌면 캐시된 렌더링 결과를 다시 만드는지 확인합니다.
+"""
+
+import os
+
+from starlette.requests import Request
+
+from base.api.templating import CachedJinja2Templates
+
+REQUEST = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+def write(path, text, mtime):
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+def test_dependent_template_change_invalidates_cache(tmp_path):
+    write(tmp_path / "base.html", "base-1 {% block body %}{% endblock %}", 1_000)
+    write(tmp_path / "part.html", "part-1", 1_000)
+    write(
+        tmp_path / "page.html",
+        '{% extends "base.html" %}{% block body %}{% include "part.html" %}{% endblock %}',
+        1_000,
+    )
+    templates = CachedJinja2Templates(tmp_path, cacheable=["page.html"])
+
+    assert templates.CachedTemplateResponse(REQUEST, "page.html").body == b"base-1 part-1"
+
+    write(tmp_path / "base.html", "base-2 {% block body %}{% endblock %}", 2_000)
+    assert templates.CachedTemplateResponse(REQUEST, "page.html").body == b"base-2 part-1"
+
+    write(tmp_path / "part.html", "part-2", 2_000)
+    assert templates.CachedTemplateResponse(REQUEST, "page.html").body == b"base-2 part-2"
+    assert len(templates._render_cache) == 1
+
+
+def test_dynamic_reference_is_not_cached(tmp_path):
+    write(tmp_path / "part.html", "part", 1_000)
+    write(tmp_path / "page.html", "{% include name %}", 1_000)
+    templates = CachedJinja2Templates(tmp_path, cacheable=["page.html"])
+
+    assert templates.CachedTemplateResponse(REQUEST, "page.html", {"name": "part.html"}).body == b"part"
+    assert len(templates._render_cache) == 0
@@ -0,0 +1,28 @@
+"""
+Filename : test_ws.py
+Title : WebSocket 채널 테스트
+Desc : 잘못된 명령과 바이너리 프레임에 오류 Message로 응답하고 연결을 유지하는지 확인합니다.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from base.api.router.ws import router
+from base.utils.auth import create_access_token
+
+
+def test_invalid_frames_get_error_message():
+    app = FastAPI()
+    app.include_router(router)
+    token = create_access_token(data={"sub": "client"})
+
+    with TestClient(app).websocket_connect(f"/ws?token={token}") as websocket:
+        websocket.send_bytes(b"\x00\x01")
+        assert websocket.receive_json()["data"] == {"detail": "Binary frames are not supported"}
+
+        websocket.send_text("not json")
+        assert websocket.receive_json()["event"] == "error"
+
+        websocket.send_json({"action": "subscribe", "topic": "t"})
+        websocket.send_json({"action": "publish", "topic": "t", "data": {"text": "hi"}})
+        assert websocket.receive_json()["data"] == {"text": "hi"}